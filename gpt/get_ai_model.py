@@ -5,20 +5,38 @@ openrouter_models.py
 
 Object‐oriented script to fetch the list of models from the OpenRouter API
 and display each model’s ID along with its prompt & completion pricing.
+The catalog is cached for 24h (in memory and in ~/.cache/socialbot/models.json)
+so restarts do not hit the API every time.
 
 Usage examples:
   $ python openrouter_models.py
   $ python openrouter_models.py --debug
+  $ python openrouter_models.py --refresh
   $ python openrouter_models.py --version
 """
 import argparse
+import json
 import logging
+import os
 import sys
-from typing import List, Optional
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
 
 import requests
 
-__version__ = "0.0.1"
+__version__ = "0.0.3"
+
+API_URL = "https://openrouter.ai/api/v1/models"
+CACHE_TTL = 24 * 3600
+CACHE_FILE = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+    "socialbot",
+    "models.json",
+)
+
+# In-process copy of the catalog: {api_url: (fetched_at, raw_models)}
+_models_memo: Dict[str, Tuple[float, List[dict]]] = {}
 
 
 class Model:
@@ -55,25 +73,80 @@ class Model:
         )
 
     @staticmethod
-    def fetch_raw_models(logger: logging.Logger) -> List[dict]:
+    def fetch_raw_models(
+        logger: logging.Logger,
+        max_age: float = CACHE_TTL,
+        cache_file: Optional[str] = CACHE_FILE,
+        background: bool = False,
+    ) -> List[dict]:
         """
         Download the raw list of models from the OpenRouter API.
 
+        A catalog fetched less than max_age seconds ago is reused, first from
+        memory, then from cache_file; pass max_age=0 to force a download.
+        If the download fails, an older cache_file is used rather than nothing.
+        With background=True, an older cache_file is returned right away and
+        the download runs in a daemon thread, refreshing the cache for later.
+
         Returns:
             A list of raw model dictionaries (empty on failure).
         """
-        API_URL = "https://openrouter.ai/api/v1/models"
+        now = time.time()
+        memo = _models_memo.get(API_URL)
+        if memo and now - memo[0] < max_age:
+            logger.debug("Using in-memory model catalog")
+            return memo[1]
+
+        cached = None
+        if cache_file:
+            try:
+                with open(cache_file, "r", encoding="utf-8") as fp:
+                    cached = json.load(fp)
+                if cached.get("url") != API_URL or not isinstance(cached.get("data"), list):
+                    cached = None
+            except (OSError, ValueError, AttributeError) as exc:
+                logger.debug("No usable model cache at %s: %s", cache_file, exc)
+                cached = None
+        if cached and max_age > 0 and now - cached.get("fetched_at", 0) < max_age:
+            logger.info("Using cached models from %s", cache_file)
+            _models_memo[API_URL] = (cached.get("fetched_at", 0), cached["data"])
+            return cached["data"]
+
+        if cached and background:
+            logger.info("Using stale cached models from %s; refreshing them in the background", cache_file)
+            threading.Thread(
+                target=Model.fetch_raw_models,
+                args=(logger, 0, cache_file),
+                name="model-catalog-refresh",
+                daemon=True,
+            ).start()
+            return cached["data"]
+
         logger.info("Fetching models from %s", API_URL)
         try:
             response = requests.get(API_URL, timeout=10)
             response.raise_for_status()
             data = response.json()
             logger.debug("Raw JSON data received: %s", data)
-            return data.get("data", [])
+            models = data.get("data", [])
         except requests.RequestException as exc:
+            if cached:
+                logger.warning("Failed to fetch models (%s); using stale cache %s", exc, cache_file)
+                return cached["data"]
             logger.warning("Failed to fetch models: %s", exc)
             return []
 
+        if models:
+            _models_memo[API_URL] = (now, models)
+            if cache_file:
+                try:
+                    os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+                    with open(cache_file, "w", encoding="utf-8") as fp:
+                        json.dump({"fetched_at": now, "url": API_URL, "data": models}, fp)
+                except OSError as exc:
+                    logger.warning("Could not write model cache %s: %s", cache_file, exc)
+        return models
+
     @staticmethod
     def process_models(
         raw_models: List[dict], logger: logging.Logger
@@ -185,6 +258,11 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
         action="store_true",
         help="enable debug logging",
     )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="ignore the cached catalog and download it again",
+    )
     parser.add_argument(
         "--version",
         action="version",
@@ -216,7 +294,7 @@ def main(argv: Optional[List[str]] = None) -> int:
     logger = logging.getLogger("openrouter_models")
 
     # Download raw model data and process into Model objects
-    raw = Model.fetch_raw_models(logger)
+    raw = Model.fetch_raw_models(logger, max_age=0 if args.refresh else CACHE_TTL)
     models = Model.process_models(raw, logger)
 
     if not models:
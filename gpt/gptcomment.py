@@ -1,10 +1,12 @@
 #!/usr/bin/env python3
 """
-article_commentator.py  (version 0.0.6)
+article_commentator.py  (version 0.0.9)
 
 Generate a colloquial summary and personal comment for an online article
 using OpenAI GPT models. If no model is supplied, selects the cheapest GPT
-model automatically.
+model automatically. Several articles can be commented with a single
+request via generate_comments_batch(), or queued at half price on the
+OpenAI Batch API via submit_comment_batch() / poll_comment_batch().
 
 Usage:
     # Show version:
@@ -28,20 +30,59 @@ Requirements:
 """
 
 import argparse
+import concurrent.futures
+import json
 import logging
 import os
 import sys
-from typing import Optional
+from typing import Dict, List, Optional
 
 import requests
 from bs4 import BeautifulSoup
 from openai import OpenAI
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    orjson = None
+
 # Ensure getmodel.py (with GPTModelSelector) is importable
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from get_ai_model import Model
 
-__version__ = "0.0.6"
+__version__ = "0.0.9"
+
+
+def fetch_article_text(link: str, logger: logging.Logger) -> str:
+    """
+    Fetches an article page and concatenates all <p> tags into one text blob.
+
+    Returns:
+        The article text, or an empty string on failure.
+    """
+    try:
+        resp = requests.get(link, timeout=10)
+        resp.raise_for_status()
+    except Exception as e:
+        logger.error("Failed to fetch article at %s: %s", link, e)
+        return ""
+
+    soup = BeautifulSoup(resp.content, "html.parser")
+    paragraphs = soup.find_all("p")
+    text = " ".join(p.get_text(strip=True) for p in paragraphs)
+    logger.debug("Extracted %d paragraphs, total %d chars", len(paragraphs), len(text))
+    return text
+
+
+def extract_article_texts(links: List[str], logger: logging.Logger) -> List[str]:
+    """
+    Fetches several articles side by side with fetch_article_text().
+
+    Returns:
+        One text per link, in the same order ('' where fetching failed).
+    """
+    with concurrent.futures.ThreadPoolExecutor() as pool:
+        return list(pool.map(lambda link: fetch_article_text(link, logger), links))
 
 
 class ArticleCommentator:
@@ -57,6 +98,7 @@ class ArticleCommentator:
         model: Optional GPT model name; if None, picks the cheapest GPT model.
         max_chars: Maximum length of the generated comment in characters.
         language: 'en' for English or 'it' for Italian.
+        client: Optional OpenAI client to reuse; a new one is created if omitted.
 
     Methods:
         extract_text() -> str: Retrieves and concatenates all <p> text from the article.
@@ -72,6 +114,7 @@ class ArticleCommentator:
         model: Optional[str] = None,
         max_chars: int = 299,
         language: str = "en",
+        client: Optional[OpenAI] = None,
     ) -> None:
         if not link:
             raise ValueError("Article URL (--link) must be provided.")
@@ -98,9 +141,9 @@ class ArticleCommentator:
             gpt_out_price = cheapest_model.completion_price
             self.logger.info("Auto‑selected cheapest GPT model: %s", self.model)
 
-        # Initialize OpenAI client
-        self.client = OpenAI(base_url=self.base_url,
-                             api_key=self.api_key)
+        # Initialize OpenAI client (or reuse the caller's)
+        self.client = client or OpenAI(base_url=self.base_url,
+                                       api_key=self.api_key)
 
     def extract_text(self) -> str:
         """
@@ -109,38 +152,26 @@ class ArticleCommentator:
         Returns:
             The article text, or an empty string on failure.
         """
-        try:
-            resp = requests.get(self.link, timeout=10)
-            resp.raise_for_status()
-        except Exception as e:
-            self.logger.error("Failed to fetch article at %s: %s", self.link, e)
-            return ""
+        return fetch_article_text(self.link, self.logger)
 
-        soup = BeautifulSoup(resp.content, "html.parser")
-        paragraphs = soup.find_all("p")
-        text = " ".join(p.get_text(strip=True) for p in paragraphs)
-        self.logger.debug("Extracted %d paragraphs, total %d chars", len(paragraphs), len(text))
-        return text
+    def lang_name(self) -> str:
+        """
+        Returns the full name of the comment language for use in prompts.
+        """
+        if self.language == "it":
+            return "Italian"
+        elif self.language == "en":
+            return "English"
+        raise ValueError("Language must be 'en' or 'it'")
 
-    def generate_comment(self) -> str:
+    def build_messages(self, article_text: str) -> List[dict]:
         """
-        Builds and sends a chat completion request to OpenAI to summarize
-        and comment on the article in the requested language.
+        Builds the system+user chat messages asking for a comment on the article.
 
         Returns:
-            The GPT‑generated comment (possibly truncated), or an empty string on failure.
+            The messages list for a chat completion request.
         """
-        article_text = self.extract_text()
-        if not article_text:
-            self.logger.error("No article text extracted; aborting comment generation.")
-            return ""
-
-        if self.language == "it":
-            lang_name = "Italian"
-        elif self.language == "en":
-            lang_name = "English"
-        else:
-            raise ValueError("Language must be 'en' or 'it'")
+        lang_name = self.lang_name()
 
         prompt = (
             f"Speak in a casual, natural, and spontaneous manner in {lang_name} about the following text, "
@@ -164,14 +195,34 @@ class ArticleCommentator:
         #     f"Reply in {lang_name}, max {self.max_chars} characters."
         # )
 
+        return [
+            {"role": "system", "content": system_msg},
+            {"role": "user", "content": prompt},
+        ]
+
+    def generate_comment(self, article_text: Optional[str] = None) -> str:
+        """
+        Builds and sends a chat completion request to OpenAI to summarize
+        and comment on the article in the requested language.
+
+        Args:
+            article_text: Already extracted article text; fetched from the link if omitted.
+
+        Returns:
+            The GPT‑generated comment (possibly truncated), or an empty string on failure.
+        """
+        if article_text is None:
+            article_text = self.extract_text()
+        if not article_text:
+            self.logger.error("No article text extracted; aborting comment generation.")
+            return ""
+
+        messages = self.build_messages(article_text)
         self.logger.debug("Sending chat completion: model=%s, max_chars=%d", self.model, self.max_chars)
         try:
             response = self.client.chat.completions.create(
                 model=self.model,
-                messages=[
-                    {"role": "system", "content": system_msg},
-                    {"role": "user", "content": prompt},
-                ],
+                messages=messages,
             )
             content = response.choices[0].message.content.strip()
             self.logger.info("Received response of %d chars", len(content))
@@ -182,6 +233,240 @@ class ArticleCommentator:
             return ""
 
 
+# Articles sent to the model in one batched request
+BATCH_SIZE = 10
+
+# Batched requests in flight at once when there are several chunks
+MAX_PARALLEL_REQUESTS = 4
+
+# Hours the Batch API is given to finish a comment batch
+BATCH_COMPLETION_WINDOW_HOURS = 24
+
+
+def _parse_comment_array(content: str, expected: int) -> Optional[List[str]]:
+    """
+    Parse the model's answer to a batched request: a JSON array with exactly
+    `expected` strings, optionally wrapped in a ``` code fence.
+    """
+    text = content.strip()
+    if text.startswith("```"):
+        text = text.strip("`")
+        text = text[text.find("\n") + 1:] if "\n" in text else ""
+    try:
+        data = orjson.loads(text) if orjson is not None else json.loads(text)
+    except ValueError:
+        return None
+    if not isinstance(data, list) or len(data) != expected:
+        return None
+    if not all(isinstance(c, str) for c in data):
+        return None
+    return [c.strip() for c in data]
+
+
+def generate_comments_batch(
+    links: List[str],
+    api_key: str,
+    logger: logging.Logger,
+    base_url: Optional[str] = None,
+    model: Optional[str] = None,
+    max_chars: int = 299,
+    language: str = "en",
+    chunk_size: int = BATCH_SIZE,
+    texts: Optional[List[str]] = None,
+) -> List[str]:
+    """
+    Comment several articles with one chat completion per chunk of
+    `chunk_size` links instead of one per link, with up to
+    MAX_PARALLEL_REQUESTS chunks in flight at once. The model is asked for a
+    JSON array of comments; if a chunk's answer cannot be parsed, its
+    articles fall back to individual requests. Pass `texts` (one per link,
+    from extract_article_texts()) to skip downloading the articles again.
+
+    Returns:
+        One comment per link, in the same order ('' where generation failed).
+    """
+    if not links:
+        return []
+
+    client = OpenAI(base_url=base_url or "https://api.openai.com/v1", api_key=api_key)
+    first = ArticleCommentator(links[0], api_key, logger, base_url, model, max_chars, language, client)
+    commentators = [first] + [
+        ArticleCommentator(link, api_key, logger, base_url, first.model, max_chars, language, client)
+        for link in links[1:]
+    ]
+    lang_name = first.lang_name()
+
+    if texts is None:
+        texts = extract_article_texts(links, logger)
+
+    comments = [""] * len(links)
+    pending = []
+    for i, text in enumerate(texts):
+        if text:
+            pending.append(i)
+        else:
+            logger.error("No article text extracted for %s; skipping comment.", links[i])
+
+    def _comment_chunk(chunk):
+        if len(chunk) == 1:
+            comments[chunk[0]] = commentators[chunk[0]].generate_comment(texts[chunk[0]])
+            return
+
+        system_msg = (
+            f"You are an expert commentator. Respond in a colloquial and natural style, without advertising or formalities. "
+            f"You will receive {len(chunk)} numbered articles. Reply ONLY with a JSON array of {len(chunk)} strings, "
+            f"where the i-th string is the comment on article i, in {lang_name}, "
+            f"with a maximum of {max_chars} characters each."
+        )
+        prompt = (
+            f"Speak in a casual, natural, and spontaneous manner in {lang_name} about each of the following texts, "
+            f"including a personal comment as if you had read it yourself:\n\n"
+            + "\n\n".join(f"[{n}]\n{texts[i]}" for n, i in enumerate(chunk, 1))
+        )
+
+        logger.debug("Sending batched chat completion: model=%s, articles=%d", first.model, len(chunk))
+        parsed = None
+        try:
+            response = client.chat.completions.create(
+                model=first.model,
+                messages=[
+                    {"role": "system", "content": system_msg},
+                    {"role": "user", "content": prompt},
+                ],
+            )
+            parsed = _parse_comment_array(response.choices[0].message.content or "", len(chunk))
+        except Exception as e:
+            logger.error("OpenAI API error: %s", e)
+
+        if parsed is None:
+            logger.warning("Batched comment request failed for %d articles; falling back to one request each",
+                           len(chunk))
+            for i in chunk:
+                comments[i] = commentators[i].generate_comment(texts[i])
+        else:
+            logger.info("Received %d comments in one response", len(parsed))
+            for i, comment in zip(chunk, parsed):
+                comments[i] = comment
+
+    # Chunks are independent requests: run them side by side rather than one
+    # round-trip after another (the OpenAI client is safe to share across threads)
+    chunks = [pending[start:start + chunk_size] for start in range(0, len(pending), chunk_size)]
+    if len(chunks) > 1:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(len(chunks), MAX_PARALLEL_REQUESTS)) as pool:
+            list(pool.map(_comment_chunk, chunks))
+    elif chunks:
+        _comment_chunk(chunks[0])
+
+    return comments
+
+
+def submit_comment_batch(
+    links: List[str],
+    api_key: str,
+    logger: logging.Logger,
+    base_url: Optional[str] = None,
+    model: Optional[str] = None,
+    max_chars: int = 299,
+    language: str = "en",
+    texts: Optional[List[str]] = None,
+) -> Optional[str]:
+    """
+    Queue one comment request per article on the OpenAI Batch API (half the
+    token price, results within 24h). The custom_id of each request is the
+    article's index in `links`. Pass `texts` (one per link, from
+    extract_article_texts()) to reuse articles that were already downloaded.
+
+    Returns:
+        The batch id, or None if nothing could be submitted.
+    """
+    if not links:
+        return None
+
+    client = OpenAI(base_url=base_url or "https://api.openai.com/v1", api_key=api_key)
+    first = ArticleCommentator(links[0], api_key, logger, base_url, model, max_chars, language, client)
+    commentators = [first] + [
+        ArticleCommentator(link, api_key, logger, base_url, first.model, max_chars, language, client)
+        for link in links[1:]
+    ]
+    if texts is None:
+        texts = extract_article_texts(links, logger)
+
+    lines = []
+    for i, (commentator, text) in enumerate(zip(commentators, texts)):
+        if not text:
+            logger.error("No article text extracted for %s; skipping comment.", links[i])
+            continue
+        lines.append(json.dumps({
+            "custom_id": str(i),
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {"model": first.model, "messages": commentator.build_messages(text)},
+        }, ensure_ascii=False))
+    if not lines:
+        return None
+
+    try:
+        upload = client.files.create(
+            file=("comments.jsonl", "\n".join(lines).encode("utf-8")), purpose="batch"
+        )
+        batch = client.batches.create(
+            input_file_id=upload.id,
+            endpoint="/v1/chat/completions",
+            completion_window=f"{BATCH_COMPLETION_WINDOW_HOURS}h",
+        )
+    except Exception as e:
+        logger.error("OpenAI Batch API error: %s", e)
+        return None
+    logger.info("Submitted comment batch %s with %d requests", batch.id, len(lines))
+    return batch.id
+
+
+def poll_comment_batch(
+    batch_id: str,
+    api_key: str,
+    logger: logging.Logger,
+    base_url: Optional[str] = None,
+) -> Optional[Dict[int, str]]:
+    """
+    Check a batch submitted with submit_comment_batch().
+
+    Returns:
+        None while the batch is still running; otherwise a mapping of article
+        index to comment (empty if the batch failed, expired or was cancelled).
+    """
+    client = OpenAI(base_url=base_url or "https://api.openai.com/v1", api_key=api_key)
+    try:
+        batch = client.batches.retrieve(batch_id)
+    except Exception as e:
+        logger.error("OpenAI Batch API error: %s", e)
+        return None
+
+    if batch.status in ("validating", "in_progress", "finalizing", "cancelling"):
+        logger.debug("Comment batch %s is %s", batch_id, batch.status)
+        return None
+    if batch.status != "completed" or not batch.output_file_id:
+        logger.warning("Comment batch %s ended with status %s", batch_id, batch.status)
+        return {}
+
+    comments: Dict[int, str] = {}
+    try:
+        output = client.files.content(batch.output_file_id).text
+    except Exception as e:
+        logger.error("OpenAI Batch API error: %s", e)
+        return None
+    for line in output.splitlines():
+        if not line.strip():
+            continue
+        try:
+            result = json.loads(line)
+            body = result["response"]["body"]
+            comments[int(result["custom_id"])] = body["choices"][0]["message"]["content"].strip()
+        except (ValueError, KeyError, IndexError, TypeError, AttributeError):
+            logger.warning("Unusable line in output of comment batch %s", batch_id)
+    logger.info("Comment batch %s completed with %d comments", batch_id, len(comments))
+    return comments
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(
         description="Generate a colloquial summary+comment for an article via OpenAI GPT."
@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 """
-rss_feeders.py  (version 0.1.2)
+rss_feeders.py  (version 0.1.4)
 
 Fetch and process the latest items from one or more RSS feeds.  Optionally
 generate AI comments on new entries via AI GPT models.
@@ -33,31 +33,103 @@ Usage:
     python rss_feeders.py --debug --feeds https://8bitsecurity.com/feed/
 
 Requirements:
-    pip install feedparser requests beautifulsoup4 openai
+    pip install aiohttp feedparser requests beautifulsoup4 openai
 """
 
 import argparse
+import asyncio
 import concurrent.futures
+import concurrent.futures.process
 import json
 import logging
 import os
 import re
 import sys
+import time
+from collections import defaultdict
+from functools import lru_cache
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
+import aiohttp
 import feedparser
 import html
 import requests
 from bs4 import BeautifulSoup
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
 # Ensure your utils.logger and gptcomment modules are on PYTHONPATH
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from utils.logger import Logger                
-from gpt.gptcomment import ArticleCommentator   
+from gpt.gptcomment import BATCH_SIZE, generate_comments_batch
+from utils.ai_cache import AICommentCache
+
+__version__ = "0.1.9"
 
-__version__ = "0.1.2"
+# Social platforms whose per-feed bot lists are merged when items collapse
+PLATFORMS = ("telegram", "bluesky", "linkedin")
+
+
+def _parse_newest_entry(content: bytes) -> Optional[Dict[str, Any]]:
+    """
+    Parse a feed body and return the raw fields of its newest dated entry,
+    or None. Module-level and returning plain data so it can run in a
+    process pool (see RSSFeeders.get_new_feeders_async).
+    """
+    feed = feedparser.parse(content)
+
+    def _entry_date(e) -> Optional[datetime]:
+        for key in ("published_parsed", "updated_parsed"):
+            struct = e.get(key)
+            if struct:
+                return datetime(*struct[:6])
+        return None
+
+    dated = [(e, _entry_date(e)) for e in feed.entries]
+    dated = [(e, dt) for e, dt in dated if dt is not None]
+    if not dated:
+        return None
+
+    # Pick the most recent entry
+    entry, dt = max(dated, key=lambda pair: pair[1])
+    tags = None
+    if isinstance(entry.get("tags"), list):
+        tags = [t.get("term") for t in entry.tags if t.get("term")]
+    media = entry.get("media_content", [])
+    return {
+        "link": entry.get("link"),
+        "datetime": dt,
+        "title": entry.get("title", ""),
+        "description": entry.get("description", "") or "",
+        "tags": tags,
+        "media_url": media[0].get("url") if media and isinstance(media, list) else None,
+        "content_html": entry.content[0].get("value", "") if entry.get("content") else "",
+        "id": entry.get("id"),
+    }
+
+
+@lru_cache(maxsize=16384)
+def canonical_link(url: str) -> str:
+    """
+    Normalize an article URL for duplicate detection: lower-case scheme and
+    host, drop utm_* tracking parameters and the #fragment. Memoized, since
+    the whole history is re-indexed on every fetch.
+    """
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return url
+    query = urlencode(
+        [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+         if not k.lower().startswith("utm_")]
+    )
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, query, ""))
 
 
 class RSSFeeders:
@@ -73,6 +145,12 @@ class RSSFeeders:
         base_url (Optional[str]): Base URL for the AI API (default: https://api.openai.com/v1).
         user_agent (Optional[str]): HTTP User-Agent header for fetching feeds.
         mutetime (Optional[bool]): If True, disables AI comment generation (default: False).
+        ai_cache (Optional[AICommentCache]): Cache consulted before asking the AI for a comment.
+        ai_batch_size (int): How many articles are commented per AI request.
+        defer_ai (bool): If True, cache misses are not commented here but collected in `deferred`.
+        validators (Optional[Dict[str, Dict[str, str]]]): Per-feed-URL ETag/Last-Modified
+            values; pass the same dict every cycle to make async fetches conditional.
+        fetch_concurrency (Optional[int]): Max feeds downloaded at once (default: FETCH_CONCURRENCY).
 
     Attributes:
         feeds (List[Dict[str, Any]]): The list of feeds to process.
@@ -82,6 +160,11 @@ class RSSFeeders:
         mutetime (bool): Whether to mute AI comment generation.
         base_url (str): Base URL for the AI API.
         user_agent (str): User-Agent string for HTTP requests.
+        ai_cache (Optional[AICommentCache]): Cache of previously generated AI comments.
+        ai_batch_size (int): How many articles are commented per AI request.
+        deferred (List[Dict[str, Any]]): New items left without a comment because defer_ai is set.
+        validators (Dict[str, Dict[str, str]]): Cache validators remembered per feed URL.
+        fetch_concurrency (int): Max feeds downloaded at once.
     """
 
     DEFAULT_USER_AGENT = (
@@ -91,6 +174,25 @@ class RSSFeeders:
     )
     DEFAULT_BASE_URL = "https://api.openai.com/v1"
 
+    # Async fetch limits (see get_new_feeders_async)
+    FETCH_CONCURRENCY = 16
+    FETCH_PER_HOST = 4
+    FETCH_RETRIES = 3
+    FETCH_BACKOFF = 1.0
+    FETCH_TIMEOUT = 10
+    FETCH_CONNECTIONS = 64
+
+    @classmethod
+    def create_session(cls) -> aiohttp.ClientSession:
+        """
+        Open an aiohttp session sized for concurrent feed downloads
+        (must be created inside a running event loop).
+        """
+        return aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=cls.FETCH_TIMEOUT),
+            connector=aiohttp.TCPConnector(limit=cls.FETCH_CONNECTIONS),
+        )
+
     def __init__(
         self,
         feeds: List[Dict[str, Any]],
@@ -99,7 +201,12 @@ class RSSFeeders:
         logger: logging.Logger,
         base_url: Optional[str] = None,
         user_agent: Optional[str] = None,
-        mutetime: Optional[bool] = False
+        mutetime: Optional[bool] = False,
+        ai_cache: Optional[AICommentCache] = None,
+        ai_batch_size: int = BATCH_SIZE,
+        defer_ai: bool = False,
+        validators: Optional[Dict[str, Dict[str, str]]] = None,
+        fetch_concurrency: Optional[int] = None
     ) -> None:
         """
         Initialize the RSSFeeders object.
@@ -112,6 +219,12 @@ class RSSFeeders:
             base_url (Optional[str]): Base URL for the AI API (default: https://api.openai.com/v1).
             user_agent (Optional[str]): HTTP User-Agent header for fetching feeds.
             mutetime (Optional[bool]): If True, disables AI comment generation (default: False).
+            ai_cache (Optional[AICommentCache]): Cache consulted before asking the AI for a comment.
+            ai_batch_size (int): How many articles are commented per AI request.
+            defer_ai (bool): If True, cache misses are not commented here but collected in `deferred`.
+            validators (Optional[Dict[str, Dict[str, str]]]): Per-feed-URL ETag/Last-Modified
+                values; pass the same dict every cycle to make async fetches conditional.
+            fetch_concurrency (Optional[int]): Max feeds downloaded at once (default: FETCH_CONCURRENCY).
         """
         self.feeds = feeds.copy()
         self.previous = previous.copy()
@@ -120,19 +233,26 @@ class RSSFeeders:
         self.mutetime = mutetime  
         self.base_url = base_url or self.DEFAULT_BASE_URL
         self.user_agent = user_agent or self.DEFAULT_USER_AGENT
+        self.ai_cache = ai_cache
+        self.ai_batch_size = max(1, int(ai_batch_size))
+        self.defer_ai = defer_ai
+        self.deferred: List[Dict[str, Any]] = []
+        self.validators = validators if validators is not None else {}
+        self.fetch_concurrency = max(1, int(fetch_concurrency or self.FETCH_CONCURRENCY))
+        self._cutoff_ts = time.time() - self.retention_days * 86400
+        self._seen_links: set = set()
 
     def _prune_previous(self) -> None:
         """
         Remove entries from self.previous that are older than retention_days.
         """
-        now = datetime.now()
-        cutoff = timedelta(days=self.retention_days)
+        oldest = datetime.now() - timedelta(days=self.retention_days)
         kept: List[Dict[str, Any]] = []
 
         for item in self.previous:
             dt = item.get("datetime")
             if isinstance(dt, datetime):
-                if now - dt <= cutoff:
+                if dt >= oldest:
                     kept.append(item)
                 else:
                     self.logger.debug("Pruned old entry %s (>%d days)",
@@ -143,6 +263,17 @@ class RSSFeeders:
 
         self.previous = kept
 
+    def _index_previous(self) -> None:
+        """
+        Prune the previous list and index its canonical links, so the per-feed
+        seen-check is a set lookup instead of a scan of the whole history, and
+        an article that returns with different utm_* parameters is still seen.
+        Also fixes this fetch's retention cutoff as an epoch timestamp.
+        """
+        self._cutoff_ts = time.time() - self.retention_days * 86400
+        self._prune_previous()
+        self._seen_links = {canonical_link(item.get("link") or "") for item in self.previous}
+
     def _extract_image(self, html_str: str) -> Optional[str]:
         """
         Extract the first <img src="..."> URL from an HTML snippet.
@@ -186,66 +317,217 @@ class RSSFeeders:
         try:
             resp = requests.get(url, headers=headers, timeout=10)
             resp.raise_for_status()
-            feed = feedparser.parse(resp.content)
         except Exception as e:
             self.logger.error("Failed to fetch/parse RSS %s: %s", url, e)
             return None
+        return self._latest_from_content(url, resp.content)
 
-        if not feed.entries:
-            return None
+    async def _fetch_rss_async(self, session: aiohttp.ClientSession, url: str) -> Optional[bytes]:
+        """
+        Download a feed body with aiohttp, honouring the global and per-host
+        concurrency caps and retrying 5xx / connection errors with exponential backoff.
+        The request is conditional on the feed's last ETag/Last-Modified, so an
+        unchanged feed costs a body-less 304.
+
+        Returns:
+            The raw response body, or None if the feed is unchanged or could not be fetched.
+        """
+        host = urlsplit(url).hostname or ""
+        headers = {"User-Agent": self.user_agent}
+        known = self.validators.get(url, {})
+        if known.get("etag"):
+            headers["If-None-Match"] = known["etag"]
+        if known.get("last_modified"):
+            headers["If-Modified-Since"] = known["last_modified"]
+        for attempt in range(self.FETCH_RETRIES + 1):
+            try:
+                async with self._fetch_limit, self._host_limits[host]:
+                    async with session.get(url, headers=headers) as resp:
+                        if resp.status == 304:
+                            self.logger.debug("Not modified since last fetch: %s", url)
+                            return None
+                        if resp.status >= 500 and attempt < self.FETCH_RETRIES:
+                            raise aiohttp.ServerConnectionError(f"HTTP {resp.status}")
+                        resp.raise_for_status()
+                        body = await resp.read()
+                        fresh = {
+                            "etag": resp.headers.get("ETag", ""),
+                            "last_modified": resp.headers.get("Last-Modified", ""),
+                        }
+                        if fresh["etag"] or fresh["last_modified"]:
+                            self.validators[url] = fresh
+                        else:
+                            self.validators.pop(url, None)
+                        return body
+            except (aiohttp.ClientConnectorError, aiohttp.ServerConnectionError,
+                    asyncio.TimeoutError) as e:
+                if attempt >= self.FETCH_RETRIES:
+                    self.logger.error("Failed to fetch/parse RSS %s: %s", url, e)
+                    return None
+                delay = self.FETCH_BACKOFF * (2 ** attempt)
+                self.logger.debug("Retrying %s in %.1fs after: %s", url, delay, e)
+                await asyncio.sleep(delay)
+            except Exception as e:
+                self.logger.error("Failed to fetch/parse RSS %s: %s", url, e)
+                return None
+        return None
 
-        def _entry_date(e) -> Optional[datetime]:
-            for key in ("published_parsed", "updated_parsed"):
-                struct = e.get(key)
-                if struct:
-                    return datetime(*struct[:6])
+    def _latest_from_content(self, url: str, content: bytes) -> Optional[Dict[str, Any]]:
+        """
+        Parse a downloaded feed body and return its newest entry
+        (within retention_days), or None.
+        """
+        try:
+            entry = _parse_newest_entry(content)
+        except Exception as e:
+            self.logger.error("Failed to fetch/parse RSS %s: %s", url, e)
             return None
+        return self._entry_info(url, entry)
 
-        dated = [(e, _entry_date(e)) for e in feed.entries]
-        dated = [(e, dt) for e, dt in dated if dt is not None]
-        if not dated:
+    def _entry_info(self, url: str, entry: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """
+        Turn the raw newest entry from _parse_newest_entry() into an item,
+        or None if there is none or it is older than retention_days.
+        """
+        if not entry:
             return None
 
-        # Pick the most recent entry
-        entry, dt = max(dated, key=lambda pair: pair[1])
-        now = datetime.now(dt.tzinfo) if dt.tzinfo else datetime.now()
-        if now - dt > timedelta(days=self.retention_days):
+        dt = entry["datetime"]
+        # one float comparison, for naive (local) and tz-aware datetimes alike
+        if dt.timestamp() < self._cutoff_ts:
             self.logger.debug("No recent entries in %s within %d days",
                               url, self.retention_days)
             return None
 
-        desc = entry.get("description", "") or ""
-        desc = self._sanitize_description(desc)
+        desc = self._sanitize_description(entry["description"])
         desc = html.unescape(desc)
 
-        title = entry.get("title", "")
+        title = entry["title"]
         if isinstance(title, bytes):
             title = title.decode("utf-8")
         title = html.unescape(title)
 
-        # Category/tags
-        cats = None
-        if isinstance(entry.get("tags"), list):
-            cats = [t.get("term") for t in entry.tags if t.get("term")]
-
         # Image: first look in media_content, else parse HTML
-        img = None
-        media = entry.get("media_content", [])
-        if media and isinstance(media, list):
-            img = media[0].get("url")
-        elif entry.get("content"):
-            img = self._extract_image(entry.content[0].get("value", ""))
+        img = entry["media_url"]
+        if img is None and entry["content_html"]:
+            img = self._extract_image(entry["content_html"])
 
         return {
-            "link": entry.get("link"),
+            "link": entry["link"],
             "datetime": dt,
             "title": title,
             "description": desc,
-            "category": cats,
-            "short_link": entry.get("id"),
+            "category": entry["tags"],
+            "short_link": entry["id"],
             "img_link": img,
         }
 
+    def _process_entry(
+        self,
+        fdict: Dict[str, Any],
+        info: Optional[Dict[str, Any]],
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Turn the newest entry of a feed into a new item: skip it if already
+        seen, otherwise merge the feed-level metadata into it.
+        """
+        if not info:
+            self.logger.debug("No new entry at %s", fdict["rss"])
+            return None
+
+        # Skip if link already seen
+        if canonical_link(info["link"] or "") in self._seen_links:
+            self.logger.debug("Already seen %s", info["link"])
+            return None
+
+        # Merge feed‑level metadata into this new entry
+        return {**fdict, **info}
+
+    def _dedupe(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Collapse new items pointing at the same article (same canonical link,
+        e.g. one story in two feeds) into the first one, merging the bot lists
+        so every target bot still gets it exactly once.
+        """
+        unique: Dict[str, Dict[str, Any]] = {}
+        for item in items:
+            key = canonical_link(item.get("link") or "")
+            first = unique.get(key)
+            if first is None:
+                unique[key] = item
+                continue
+            self.logger.debug("Duplicate new item %s (from %s)", item.get("link"), item.get("rss"))
+            first["ai"] = bool(first.get("ai") or item.get("ai"))
+            for platform in PLATFORMS:
+                bots = item.get(platform, {}).get("bots", [])
+                if not bots:
+                    continue
+                merged = list(first.get(platform, {}).get("bots", []))
+                merged += [b for b in bots if b not in merged]
+                # copy: the platform dicts are shared with the feed definitions
+                first[platform] = {**first.get(platform, {}), "bots": merged}
+        return list(unique.values())
+
+    def _add_ai_comments(
+        self,
+        items: List[Dict[str, Any]],
+        ai_key: Optional[str],
+        gptmodel: Optional[str],
+        max_chars: int,
+        language: str,
+    ) -> None:
+        """
+        Fill 'ai-comment' on every new item whose feed asks for one, reusing
+        cached comments for identical content and generating the rest in
+        batched AI requests.
+        """
+        if not (ai_key and gptmodel) or self.mutetime:
+            return
+
+        missing: List[Tuple[Dict[str, Any], Optional[bytes]]] = []
+        for out in items:
+            if not out.get("ai"):
+                continue
+            cache_key = None
+            if self.ai_cache is not None:
+                cache_key = AICommentCache.make_key(
+                    gptmodel, language, max_chars, out["title"], out["description"]
+                )
+                out["ai-comment"] = self.ai_cache.get(cache_key) or ""
+            if out.get("ai-comment"):
+                self.logger.debug("AI comment cache hit for %s", out["link"])
+            else:
+                missing.append((out, cache_key))
+
+        if missing and self.defer_ai:
+            # The caller comments these later (e.g. through the Batch API)
+            self.deferred = [out for out, _ in missing]
+            for out in self.deferred:
+                out.setdefault("ai-comment", "")
+            self.logger.debug("Deferred AI comments for %d items", len(self.deferred))
+        elif missing:
+            comments = generate_comments_batch(
+                [out["link"] for out, _ in missing],
+                api_key=ai_key,
+                logger=self.logger,
+                base_url=self.base_url,
+                model=gptmodel,
+                max_chars=max_chars,
+                language=language,
+                chunk_size=self.ai_batch_size,
+            )
+            for (out, _), comment in zip(missing, comments):
+                out["ai-comment"] = comment
+            if self.ai_cache is not None:
+                self.ai_cache.set_many(
+                    (cache_key, out["ai-comment"]) for out, cache_key in missing
+                )
+
+        for out in items:
+            if out.get("ai"):
+                self.logger.info("Discovered new RSS item: %s", out["link"])
+                self.logger.info("Comment new RSS item: %s", out["ai-comment"])
+
     def get_new_feeders(
         self,
         ai_key: Optional[str] = None,
@@ -254,56 +536,100 @@ class RSSFeeders:
         language: str = "en",
     ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
         """
-        Process all feeds in parallel, compare to previously seen entries,
-        and return any NEW items + the updated previous list (pruned/extended).
+        Process all feeds in parallel (fetch_concurrency threads), compare to
+        previously seen entries, and return any NEW items + the updated
+        previous list (pruned/extended).
 
         If ai_key & gptmodel are provided, also generate an AI comment
-        for feeds whose dict has feed['ai'] == True.
+        for feeds whose dict has feed['ai'] == True (batched, several
+        items per AI request).
 
         Returns:
             new_items: List of new feed‑dicts (with same keys + optional 'ai-comment').
             previous:  The updated previous list, pruned by retention_days.
         """
-        self._prune_previous()
-        new_items: List[Dict[str, Any]] = []
+        self._index_previous()
 
         def _worker(fdict: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-            info = self.get_latest_rss(fdict["rss"])
-            if not info:
-                self.logger.debug("No new entry at %s", fdict["rss"])
-                return None
+            return self._process_entry(fdict, self.get_latest_rss(fdict["rss"]))
 
-            # Skip if link already seen
-            if any(prev.get("link") == info["link"] for prev in self.previous):
-                self.logger.debug("Already seen %s", info["link"])
-                return None
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.fetch_concurrency) as pool:
+            futures = pool.map(_worker, self.feeds)
+            new_items = self._dedupe([r for r in futures if r])
+        self.previous.extend(new_items)
+
+        self._add_ai_comments(new_items, ai_key, gptmodel, max_chars, language)
+
+        # Final prune before returning
+        self._prune_previous()
+        return new_items, self.previous
 
-            # Merge feed‑level metadata into this new entry
-            out = {**fdict, **info}
-
-            # Optionally generate AI comment
-            if fdict.get("ai") and ai_key and gptmodel and not self.mutetime:
-                commentator = ArticleCommentator(
-                    link=out["link"],
-                    api_key=ai_key,
-                    logger=self.logger,
-                    model=gptmodel,
-                    base_url=self.base_url,
-                    max_chars=max_chars,
-                    language=language,
+    async def get_new_feeders_async(
+        self,
+        ai_key: Optional[str] = None,
+        gptmodel: Optional[str] = None,
+        max_chars: int = 160,
+        language: str = "en",
+        session: Optional[aiohttp.ClientSession] = None,
+        parse_pool: Optional[concurrent.futures.ProcessPoolExecutor] = None,
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Asyncio counterpart of get_new_feeders(): feeds are downloaded
+        concurrently over aiohttp (at most fetch_concurrency in flight and
+        FETCH_PER_HOST per host); feed parsing and the batched AI comments
+        run in worker threads so the event loop is never blocked.
+
+        Args:
+            session (Optional[aiohttp.ClientSession]): Shared session to reuse
+                pooled connections; a private one is opened if omitted.
+            parse_pool (Optional[concurrent.futures.ProcessPoolExecutor]): Process
+                pool for the CPU-bound feedparser step, so large feeds are parsed
+                on several cores instead of contending for the GIL.
+
+        Returns:
+            Same (new_items, previous) tuple as get_new_feeders().
+        """
+        self._index_previous()
+        self._fetch_limit = asyncio.Semaphore(self.fetch_concurrency)
+        self._host_limits = defaultdict(lambda: asyncio.Semaphore(self.FETCH_PER_HOST))
+
+        async def _parse(url: str, content: bytes) -> Optional[Dict[str, Any]]:
+            if parse_pool is None:
+                return await asyncio.to_thread(self._latest_from_content, url, content)
+            try:
+                entry = await asyncio.get_running_loop().run_in_executor(
+                    parse_pool, _parse_newest_entry, content
                 )
-                out["ai-comment"] = commentator.generate_comment()
-                self.logger.info("Discovered new RSS item: %s", out["link"])
-                self.logger.info("Comment new RSS item: %s", out["ai-comment"])
+            except concurrent.futures.process.BrokenProcessPool:
+                self.logger.warning("Parser process pool is broken; parsing %s in a thread", url)
+                return await asyncio.to_thread(self._latest_from_content, url, content)
+            except Exception as e:
+                self.logger.error("Failed to fetch/parse RSS %s: %s", url, e)
+                return None
+            return self._entry_info(url, entry)
 
-            return out
+        async def _worker(fdict: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            content = await self._fetch_rss_async(http, fdict["rss"])
+            info = None
+            if content is not None:
+                info = await _parse(fdict["rss"], content)
+            return self._process_entry(fdict, info)
 
-        with concurrent.futures.ThreadPoolExecutor() as pool:
-            futures = pool.map(_worker, self.feeds)
-            for result in futures:
-                if result:
-                    new_items.append(result)
-                    self.previous.append(result)
+        http = session or self.create_session()
+        try:
+            results = await asyncio.gather(*(_worker(f) for f in self.feeds), return_exceptions=True)
+        finally:
+            if session is None:
+                await http.close()
+
+        for fdict, result in zip(self.feeds, results):
+            if isinstance(result, Exception):
+                self.logger.error("Failed to process RSS %s: %s", fdict.get("rss"), result)
+        new_items = self._dedupe([r for r in results if r and not isinstance(r, Exception)])
+        self.previous.extend(new_items)
+        await asyncio.to_thread(
+            self._add_ai_comments, new_items, ai_key, gptmodel, max_chars, language
+        )
 
         # Final prune before returning
         self._prune_previous()
@@ -317,7 +643,8 @@ def _load_previous(path: Path) -> List[Dict[str, Any]]:
     if not path.is_file():
         return []
     try:
-        raw = json.loads(path.read_text(encoding="utf-8"))
+        text = path.read_bytes()
+        raw = orjson.loads(text) if orjson is not None else json.loads(text)
         # Convert ISO‑strings back to datetime
         for item in raw:
             if "datetime" in item and isinstance(item["datetime"], str):
@@ -338,7 +665,21 @@ def _save_previous(path: Path, data: List[Dict[str, Any]]) -> None:
         if isinstance(dt, datetime):
             copy["datetime"] = dt.isoformat()
         out.append(copy)
-    path.write_text(json.dumps(out, indent=2, ensure_ascii=False), encoding="utf-8")
+    path.write_bytes(_dumps_pretty(out))
+
+
+def _dumps_pretty(data: Any) -> bytes:
+    """
+    Pretty-print data as UTF-8 JSON, using orjson when it is installed.
+    Datetimes are written via str() by either backend.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            data,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+        )
+    return json.dumps(data, indent=2, ensure_ascii=False, default=str).encode("utf-8")
 
 
 def main() -> None:
@@ -439,7 +780,7 @@ def main() -> None:
 
     # Output results
     if new_items:
-        print(json.dumps(new_items, indent=2, ensure_ascii=False, default=str))
+        print(_dumps_pretty(new_items).decode("utf-8"))
     else:
         logger.info("No new RSS items found.")
 
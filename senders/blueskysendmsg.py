@@ -38,6 +38,7 @@ import html
 import json
 import logging
 import re
+import threading
 import time
 from datetime import datetime, timezone
 from urllib.parse import urljoin
@@ -48,7 +49,7 @@ from bs4 import BeautifulSoup
 # ------------------------------------------------------------------------------
 # Module version
 # ------------------------------------------------------------------------------
-__version__ = "1.0.1"
+__version__ = "1.1.0"
 
 # ------------------------------------------------------------------------------
 # Module‐level logging configuration
@@ -68,8 +69,9 @@ class BlueskyPoster:
         service (str): Base URL of the Bluesky instance (default 'https://bsky.social').
         user_agent (str): User‐Agent string for fetching previews.
         access_jwt (str): JWT obtained after authentication.
+        refresh_jwt (str): JWT used to renew access_jwt once it expires.
         did (str): Decentralized identifier for the authenticated user.
-        session (requests.Session): Session to reuse connections and headers.
+        session (requests.Session): Session to reuse connections (may be shared).
         logger (logging.Logger): Logger for this class.
     """
 
@@ -81,14 +83,17 @@ class BlueskyPoster:
     MAX_POST_LENGTH = 299  # Bluesky’s maximum post length in characters
 
     def __init__(self, handle, app_password, service="https://bsky.social",
-                 user_agent=None, logger=None):
+                 user_agent=None, logger=None, session=None):
         self.handle = handle
         self.app_password = app_password
         self.service = service.rstrip("/")  # Ensure no trailing slash
         self.access_jwt = None
+        self.refresh_jwt = None
         self.did = None
+        # A poster may be shared by concurrent sends: renew the session once
+        self._session_lock = threading.Lock()
         self.user_agent = user_agent or self.DEFAULT_USER_AGENT
-        self.session = requests.Session()
+        self.session = session or requests.Session()
         self.logger = logger or logging.getLogger(self.__class__.__name__)
 
     def create_session(self):
@@ -96,15 +101,99 @@ class BlueskyPoster:
         Authenticate to Bluesky and store access_jwt & did for future requests.
         Raises an exception on failure.
         """
-        resp = requests.post(
+        resp = self.session.post(
             f"{self.service}/xrpc/com.atproto.server.createSession",
             json={"identifier": self.handle, "password": self.app_password},
         )
         resp.raise_for_status()
-        session = resp.json()
+        self._store_session(resp.json())
+        self.logger.info("Successfully authenticated as %s", self.handle)
+
+    def refresh_session(self):
+        """
+        Renew access_jwt with the refresh token (refreshSession), logging in
+        again if there is no refresh token or it is rejected too.
+        Raises an exception on failure.
+        """
+        if self.refresh_jwt:
+            resp = self.session.post(
+                f"{self.service}/xrpc/com.atproto.server.refreshSession",
+                headers={"Authorization": f"Bearer {self.refresh_jwt}"},
+            )
+            if resp.ok:
+                self._store_session(resp.json())
+                self.logger.debug("Refreshed session for %s", self.handle)
+                return
+            self.logger.debug("Session refresh rejected (%s); logging in again", resp.status_code)
+        self.create_session()
+
+    def _store_session(self, session):
+        """
+        Private helper: keep the tokens and DID from a session response.
+        """
         self.access_jwt = session["accessJwt"]
+        self.refresh_jwt = session.get("refreshJwt")
         self.did = session["did"]
-        self.logger.info("Successfully authenticated as %s", self.handle)
+
+    def _ensure_session(self):
+        """
+        Private helper: log in unless a session is already open.
+        """
+        if not self.access_jwt or not self.did:
+            with self._session_lock:
+                if not self.access_jwt or not self.did:
+                    self.create_session()
+
+    @staticmethod
+    def _token_expired(resp):
+        """
+        Private helper: tell whether a response rejects the access token.
+        """
+        if resp.status_code == 401:
+            return True
+        if resp.status_code == 400:
+            try:
+                return resp.json().get("error") in ("ExpiredToken", "InvalidToken")
+            except ValueError:
+                return False
+        return False
+
+    def _authed_post(self, nsid, headers=None, **kwargs):
+        """
+        POST to an authenticated XRPC method with the current access token,
+        renewing the session and retrying once if the token has expired.
+
+        Returns:
+            requests.Response: The server response (not checked for errors).
+        """
+        self._ensure_session()
+        token = self.access_jwt
+        resp = self.session.post(
+            f"{self.service}/xrpc/{nsid}",
+            headers={**(headers or {}), "Authorization": f"Bearer {token}"},
+            **kwargs,
+        )
+        if not self._token_expired(resp):
+            return resp
+        with self._session_lock:
+            # another send may have renewed it while this one was waiting
+            if self.access_jwt == token:
+                self.logger.info("Bluesky session for %s expired; renewing it", self.handle)
+                self.refresh_session()
+        return self.session.post(
+            f"{self.service}/xrpc/{nsid}",
+            headers={**(headers or {}), "Authorization": f"Bearer {self.access_jwt}"},
+            **kwargs,
+        )
+
+    def ping(self):
+        """
+        Check the credentials by opening a session (nothing is posted); the
+        tokens are kept for the next posts.
+        Raises an exception on failure.
+        """
+        with self._session_lock:
+            self.create_session()
 
     def create_simple_embed(self, url, title=None, description=None):
         """
@@ -144,11 +233,10 @@ class BlueskyPoster:
             "User-Agent": self.user_agent,
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
         }
-        self.session.headers.update(headers)
 
         try:
             time.sleep(1)  # polite delay
-            resp = self.session.get(url, timeout=15)
+            resp = self.session.get(url, headers=headers, timeout=15)
             resp.raise_for_status()
             soup = BeautifulSoup(resp.text, "html.parser")
 
@@ -192,17 +280,14 @@ class BlueskyPoster:
             if og_img and og_img.get("content"):
                 img_url = urljoin(url, og_img["content"])
                 time.sleep(0.5)
-                img_resp = self.session.get(img_url, timeout=15)
+                img_resp = self.session.get(img_url, headers=headers, timeout=15)
                 img_resp.raise_for_status()
                 content_type = img_resp.headers.get("Content-Type", "image/jpeg")
                 if len(img_resp.content) <= 1_000_000:
                     self.logger.debug("Uploading image blob from %s", img_url)
-                    blob_resp = self.session.post(
-                        f"{self.service}/xrpc/com.atproto.repo.uploadBlob",
-                        headers={
-                            "Content-Type": content_type,
-                            "Authorization": f"Bearer {self.access_jwt}",
-                        },
+                    blob_resp = self._authed_post(
+                        "com.atproto.repo.uploadBlob",
+                        headers={"Content-Type": content_type},
                         data=img_resp.content,
                     )
                     blob_resp.raise_for_status()
@@ -274,8 +359,7 @@ class BlueskyPoster:
         Returns:
             dict: The server JSON response.
         """
-        if not self.access_jwt or not self.did:
-            self.create_session()
+        self._ensure_session()
 
         now = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
         # Reserve characters for the link itself and newline
@@ -298,9 +382,8 @@ class BlueskyPoster:
             post_record["facets"] = facets
 
         self.logger.info("Posting without preview...")
-        resp = requests.post(
-            f"{self.service}/xrpc/com.atproto.repo.createRecord",
-            headers={"Authorization": f"Bearer {self.access_jwt}"},
+        resp = self._authed_post(
+            "com.atproto.repo.createRecord",
             json={"repo": self.did, "collection": "app.bsky.feed.post", "record": post_record},
         )
         if not resp.ok:
@@ -322,8 +405,7 @@ class BlueskyPoster:
         Returns:
             dict: The server JSON response.
         """
-        if not self.access_jwt or not self.did:
-            self.create_session()
+        self._ensure_session()
 
         # Build the post text
         if ai_comment:
@@ -353,12 +435,12 @@ class BlueskyPoster:
             post_record["facets"] = facets
 
         self.logger.info("Posting feed with preview...")
-        self.logger.debug("Post payload (first 500 chars): %s",
-                          json.dumps(post_record, indent=2, default=str)[:500] + "...")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Post payload (first 500 chars): %s",
+                              json.dumps(post_record, indent=2, default=str)[:500] + "...")
 
-        resp = requests.post(
-            f"{self.service}/xrpc/com.atproto.repo.createRecord",
-            headers={"Authorization": f"Bearer {self.access_jwt}"},
+        resp = self._authed_post(
+            "com.atproto.repo.createRecord",
             json={"repo": self.did, "collection": "app.bsky.feed.post", "record": post_record},
         )
         if not resp.ok:
@@ -464,14 +546,16 @@ def main():
             more_info=args.more_info,
         )
         logger.info("Posted feed with preview successfully.")
-        logger.debug("Server response: %s", json.dumps(result, indent=2))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Server response: %s", json.dumps(result, indent=2))
     except Exception as exc:
         logger.error("Failed to post with preview: %s", exc)
         logger.info("Retrying to post without preview...")
         try:
             result = poster.post_without_preview(args.description, args.link)
             logger.info("Posted feed without preview successfully.")
-            logger.debug("Server response: %s", json.dumps(result, indent=2))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Server response: %s", json.dumps(result, indent=2))
         except Exception as exc2:
             logger.error("All posting attempts failed: %s", exc2)
 
@@ -20,7 +20,7 @@ Usage examples:
     python linkedin_publisher.py ... --debug
 """
 
-__version__ = "0.0.3"
+__version__ = "0.0.4"
 
 import sys
 import os
@@ -53,6 +53,8 @@ class LinkedInPublisher:
         api_url (str): Base URL for LinkedIn’s REST API (default: https://api.linkedin.com/v2/).
         user_agent (str, optional): Custom User-Agent header.
         logger (logging.Logger, optional): Logger to use (default module logger).
+        session (requests.Session, optional): Shared HTTP session to reuse
+            pooled connections; a private one is created if omitted.
     """
     DEFAULT_USER_AGENT = (
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -65,20 +67,22 @@ class LinkedInPublisher:
                  urn=None,
                  api_url="https://api.linkedin.com/v2/",
                  user_agent=None,
-                 logger=None):
+                 logger=None,
+                 session=None):
         self.access_token = access_token
         self.api_url = api_url.rstrip("/") + "/"
         self.user_agent = user_agent or self.DEFAULT_USER_AGENT
         self.logger = logger or logging.getLogger(self.__class__.__name__)
-        # Fetch or accept a provided URN
-        self.urn = urn or self.get_user_urn()
-        # Common headers for all LinkedIn calls
+        self.session = session or requests.Session()
+        # Common headers for all LinkedIn calls (needed by get_user_urn below)
         self.headers = {
             "Authorization": f"Bearer {self.access_token}",
             "X-Restli-Protocol-Version": "2.0.0",
             "User-Agent": self.user_agent,
             "Accept": "application/json",
         }
+        # Fetch or accept a provided URN
+        self.urn = urn or self.get_user_urn()
 
     def get_user_urn(self):
         """
@@ -89,14 +93,28 @@ class LinkedInPublisher:
         Raises:
             requests.HTTPError on failure.
         """
-        self.logger.debug("Fetching user URN via /userinfo with headers:\n%s",
-                          json.dumps(self.headers, indent=2))
-        resp = requests.get(f"{self.api_url}userinfo", headers=self.headers)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Fetching user URN via /userinfo with headers:\n%s",
+                              json.dumps(self.headers, indent=2))
+        resp = self.session.get(f"{self.api_url}userinfo", headers=self.headers)
         resp.raise_for_status()
         urn = resp.json().get("sub")
         self.logger.info("Retrieved user URN: %s", urn)
         return urn
 
+    def ping(self):
+        """
+        Check the access token with a /userinfo call; nothing is posted.
+
+        Returns:
+            dict: The JSON response from /userinfo.
+        Raises:
+            requests.HTTPError on failure.
+        """
+        resp = self.session.get(f"{self.api_url}userinfo", headers=self.headers)
+        resp.raise_for_status()
+        return resp.json()
+
     def post_link(self, text, link, category=None):
         """
         Publish a post containing a link and optional hashtags.
@@ -143,9 +161,10 @@ class LinkedInPublisher:
             }
         }
 
-        self.logger.debug("POST payload to /ugcPosts:\n%s",
-                          json.dumps(payload, indent=2, ensure_ascii=False))
-        resp = requests.post(f"{self.api_url}ugcPosts", headers=self.headers, json=payload)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("POST payload to /ugcPosts:\n%s",
+                              json.dumps(payload, indent=2, ensure_ascii=False))
+        resp = self.session.post(f"{self.api_url}ugcPosts", headers=self.headers, json=payload)
         resp.raise_for_status()
         self.logger.info("LinkedIn post created successfully.")
         return resp.json()
@@ -228,7 +247,8 @@ def main():
             link=args.link,
             category=args.category or []
         )
-        logger.debug("LinkedIn API response:\n%s", json.dumps(result, indent=2))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("LinkedIn API response:\n%s", json.dumps(result, indent=2))
     except Exception as e:
         logger.error("Failed to create LinkedIn post: %s", e)
 
@@ -47,7 +47,7 @@ EXAMPLE FEED STRUCTURE:
 }
 """
 
-__version__ = "0.0.7"
+__version__ = "0.0.16"
 
 import argparse
 import logging
@@ -55,9 +55,14 @@ import sys
 import os
 import asyncio
 import random
+import time
 from urllib.parse import urlparse
 from functools import partial
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
 # Add parent directory to sys.path for local imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -68,6 +73,9 @@ from senders.linkedinpublisher import LinkedInPublisher
 
 LOG_FORMAT = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
 
+# (connect, read) seconds for publisher calls that don't pass their own timeout
+HTTP_TIMEOUT = (3.05, 30)
+
 def is_valid_url(url):
     """
     Check if a string is a valid HTTP/HTTPS URL.
@@ -78,12 +86,80 @@ def is_valid_url(url):
     except Exception:
         return False
 
-async def run_in_thread(func, *args, **kwargs):
+class _TimeoutHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that applies a default timeout to requests made without one,
+    so a stalled API cannot hold a send thread forever.
+    """
+
+    def __init__(self, *args, timeout=HTTP_TIMEOUT, **kwargs):
+        self.timeout = timeout
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, **kwargs):
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+        return super().send(request, **kwargs)
+
+def create_http_session(pool_size=10):
+    """
+    Build a requests.Session with a connection pool large enough to be shared
+    by concurrent publisher calls running in worker threads.
+
+    Failed connections are retried with backoff, as are 429/5xx answers to
+    idempotent requests (GET); a POST that reached the server is never
+    replayed, so a post cannot be published twice.
+
+    Args:
+        pool_size (int): Max pooled connections kept per host.
+
+    Returns:
+        requests.Session: Session with HTTP keep-alive pooling for http/https.
+    """
+    session = requests.Session()
+    retries = Retry(
+        total=3,
+        read=0,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        raise_on_status=False,
+    )
+    adapter = _TimeoutHTTPAdapter(pool_connections=10, pool_maxsize=pool_size, max_retries=retries)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+class TokenBucket:
     """
-    Run a blocking function in a thread for async compatibility.
+    Asyncio token bucket: lets through at most `rate` calls per second on
+    average, with bursts of up to `capacity` calls.
+
+    Args:
+        rate (float): Tokens added per second.
+        capacity (float): Maximum tokens stored (default: 1, i.e. no bursts).
     """
-    loop = asyncio.get_running_loop()
-    return await loop.run_in_executor(None, partial(func, *args, **kwargs))
+
+    def __init__(self, rate, capacity=1.0):
+        self.rate = float(rate)
+        self.capacity = max(1.0, float(capacity))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """
+        Wait until a token is available and take it.
+        """
+        async with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+                self.tokens = 1.0
+                self.updated = time.monotonic()
+            self.tokens -= 1
+
 
 class SocialSender:
     """
@@ -92,11 +168,173 @@ class SocialSender:
     Args:
         reader (JSONReader): JSONReader instance for reading bot credentials.
         logger (logging.Logger): Logger for output (INFO/DEBUG/etc).
+        send_limits (dict, optional): Mapping of platform name ("telegram",
+            "bluesky", "linkedin") to an asyncio.Semaphore bounding how many
+            sends to that platform may run at once. Unlisted platforms are unbounded.
+        session (requests.Session, optional): HTTP session shared by every
+            publisher, so TLS connections are reused across items and platforms.
+        send_rates (dict, optional): Mapping of platform name to the max messages
+            per second sent to any single bot of that platform (e.g. one Telegram
+            chat); missing or 0 means unlimited.
+        executor (concurrent.futures.Executor, optional): Thread pool the blocking
+            publisher calls run in, so sends don't compete with other
+            to_thread() work for the loop's default executor; shut down by close().
     """
 
-    def __init__(self, reader, logger):
+    PLATFORMS = ("telegram", "bluesky", "linkedin")
+
+    def __init__(self, reader, logger, send_limits=None, session=None, send_rates=None, executor=None):
+        # (platform, bot_name) pairs whose credentials warmup() saw rejected
+        self._rejected = set()
         self.reader = reader
         self.logger = logger
+        self.send_limits = send_limits or {}
+        self.session = session or create_http_session()
+        self.send_rates = send_rates or {}
+        self.executor = executor
+        self._buckets = {}
+        self._publishers = {}
+
+    @property
+    def reader(self):
+        return self._reader
+
+    @reader.setter
+    def reader(self, reader):
+        # New settings may carry fixed credentials: give rejected bots another chance
+        self._reader = reader
+        self._rejected.clear()
+
+    def close(self):
+        """
+        Close the HTTP session and its pooled connections, and the send executor.
+        """
+        self.session.close()
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def is_deliverable(self, feed: dict, ismute: bool = False) -> bool:
+        """
+        Tell whether at least one bot configured for this feed would receive it,
+        i.e. is not skipped by its mute flag while ismute is True.
+
+        Args:
+            feed (dict): Feed entry (or feed definition) with per-platform bot lists.
+            ismute (bool): Whether the mute window is currently active.
+
+        Returns:
+            bool: True if sending the feed would reach at least one bot.
+        """
+        for platform in self.PLATFORMS:
+            for bot_name in feed.get(platform, {}).get("bots", []):
+                mute = self.reader.get_social_values(platform, bot_name)[3]
+                if not (mute and ismute) and (platform, bot_name) not in self._rejected:
+                    return True
+        return False
+
+    def _publisher(self, platform, bot_name, factory, *credentials):
+        """
+        Return the publisher for (platform, bot), built with factory(*credentials)
+        on first use and rebuilt only if the credentials change (settings reload).
+        """
+        key = (platform, bot_name)
+        cached = self._publishers.get(key)
+        if cached is None or cached[0] != credentials:
+            cached = self._publishers[key] = (credentials, factory(*credentials))
+        return cached[1]
+
+    def _telegram_publisher(self, bot_name, token, chat_id):
+        return self._publisher(
+            "telegram", bot_name, partial(TelegramBotPublisher, session=self.session), token, chat_id
+        )
+
+    def _bluesky_publisher(self, bot_name, handle, password, service):
+        # cached so the session (JWT) is reused across posts, renewed on expiry
+        return self._publisher(
+            "bluesky", bot_name, partial(BlueskyPoster, session=self.session), handle, password, service
+        )
+
+    def _linkedin_publisher(self, bot_name, access_token, urn):
+        return self._publisher(
+            "linkedin", bot_name,
+            partial(LinkedInPublisher, logger=self.logger, session=self.session),
+            access_token, urn,
+        )
+
+    def _ping(self, platform, bot_name):
+        """
+        Private helper: build one bot's publisher and make its cheap
+        authenticated call (blocking; run in the send executor).
+        """
+        first, second, service, _ = self.reader.get_social_values(platform, bot_name)
+        if first is None:
+            return  # unknown or incomplete bot, already reported by the reader
+        if platform == "telegram":
+            self._telegram_publisher(bot_name, first, second).ping()
+        elif platform == "bluesky":
+            self._bluesky_publisher(bot_name, first, second, service).ping()
+        else:
+            self._linkedin_publisher(bot_name, second, first).ping()
+
+    async def warmup(self, feeds):
+        """
+        Probe every bot the given feeds send to, once, before the first cycle:
+        Telegram getMe, Bluesky createSession, LinkedIn /userinfo. A bad
+        token then shows up at startup instead of after a cycle's fetch and
+        AI spend, and the pooled connections are already open for the first
+        send. Bots whose credentials are rejected (HTTP 401/403) are skipped
+        until the settings are reloaded; any other failure is only logged.
+
+        Args:
+            feeds (list[dict]): Feed definitions with per-platform bot lists.
+        """
+        bots = sorted({
+            (platform, bot_name)
+            for feed in feeds
+            for platform in self.PLATFORMS
+            for bot_name in feed.get(platform, {}).get("bots", [])
+        })
+        if not bots:
+            return
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(
+            *(loop.run_in_executor(self.executor, self._ping, platform, bot_name)
+              for platform, bot_name in bots),
+            return_exceptions=True,
+        )
+        for (platform, bot_name), result in zip(bots, results):
+            if not isinstance(result, Exception):
+                self.logger.debug("Warm-up of %s bot '%s' succeeded.", platform, bot_name)
+                continue
+            response = getattr(result, "response", None)
+            if response is not None and response.status_code in (401, 403):
+                self._rejected.add((platform, bot_name))
+                self.logger.error(
+                    "%s bot '%s' rejected its credentials (%s); skipping it until settings are reloaded.",
+                    platform, bot_name, result
+                )
+            else:
+                self.logger.warning("Warm-up of %s bot '%s' failed: %s", platform, bot_name, result)
+
+    async def _send(self, platform, bot_name, func, *args, **kwargs):
+        """
+        Run a blocking publisher call in the send executor, first waiting for the bot's
+        send-rate token (if any), then holding the platform's semaphore (if
+        any) only for the duration of the network call.
+        """
+        rate = self.send_rates.get(platform)
+        if rate:
+            bucket = self._buckets.get((platform, bot_name))
+            if bucket is None:
+                bucket = self._buckets[(platform, bot_name)] = TokenBucket(rate)
+            await bucket.acquire()
+        loop = asyncio.get_running_loop()
+        call = partial(func, *args, **kwargs)
+        limit = self.send_limits.get(platform)
+        if limit is None:
+            return await loop.run_in_executor(self.executor, call)
+        async with limit:
+            return await loop.run_in_executor(self.executor, call)
 
     async def send_to_telegram(self, feed: dict, ismute: bool = False):
         """
@@ -107,36 +345,131 @@ class SocialSender:
             ismute (bool): If True, override individual bot mute flags (send anyway).
         """
         bots = feed.get("telegram", {}).get("bots", [])
+        title = feed.get("title", "")
         tasks = []
+        msg = None  # built once, on the first bot that is not muted
         for bot_name in bots:
             token, chat_id, _, mute = self.reader.get_social_values("telegram", bot_name)
             if mute and ismute:
                 self.logger.debug(
-                    "Skipping Telegram message for '%s' due to mute setting.", feed.get("title", "")
+                    "Skipping Telegram message for '%s' due to mute setting.", title
                 )
                 continue
-            self.logger.debug(
-                "Sending new feed to Telegram bot '%s' → %s",
-                bot_name, feed.get("title", "")
-            )
+            if ("telegram", bot_name) in self._rejected:
+                continue
+            self.logger.debug("Sending new feed to Telegram bot '%s' → %s", bot_name, title)
             self.logger.debug(
                 "TelegramBotPublisher initialized with token=%s, chat_id=%s", token, chat_id
             )
-            telebot = TelegramBotPublisher(token, chat_id)
-            if not is_valid_url(feed.get("short_link")):
-                link_to_use = feed.get("link", "")
-                self.logger.error("Invalid URL: %s", feed.get("short_link"))
-                self.logger.info("New URL: %s", link_to_use)
-            else:
-                link_to_use = feed.get("short_link") or feed.get("link", "")
-            msg = f"{feed.get('title','')}\n{feed.get('description','')}\n{link_to_use}"
-            self.logger.debug("Payload for Telegram: %s", msg.replace("\n", " | "))
+            telebot = self._telegram_publisher(bot_name, token, chat_id)
+            if msg is None:
+                msg = self._telegram_text(feed)
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("Payload for Telegram: %s", msg.replace("\n", " | "))
             tasks.append(
-                run_in_thread(telebot.send_message, msg)
+                self._send("telegram", bot_name, telebot.send_message, msg)
             )
         if tasks:
             await asyncio.gather(*tasks)
 
+    def _link_for(self, feed: dict) -> str:
+        """
+        Pick the link to publish: the short link if it is a valid URL, else the full link.
+        """
+        if not is_valid_url(feed.get("short_link")):
+            link_to_use = feed.get("link", "")
+            self.logger.error("Invalid URL: %s", feed.get("short_link"))
+            self.logger.info("New URL: %s", link_to_use)
+            return link_to_use
+        return feed.get("short_link") or feed.get("link", "")
+
+    def _telegram_text(self, feed: dict, limit: int = 0) -> str:
+        """
+        Build the Telegram text for a feed: title, description and link. With a
+        limit (album captions), the description is shortened to fit it.
+        """
+        link_to_use = self._link_for(feed)
+        title = feed.get("title", "")
+        description = feed.get("description", "")
+        msg = f"{title}\n{description}\n{link_to_use}"
+        if limit and len(msg) > limit:
+            room = max(0, limit - len(title) - len(link_to_use) - 3)
+            msg = f"{title}\n{description[:room]}…\n{link_to_use}"[:limit]
+        return msg
+
+    async def send_batch_to_telegram(self, feeds: list, ismute: bool = False,
+                                     albums: bool = True, digest: bool = False):
+        """
+        Send several feeds to their Telegram bots, grouping each bot's feeds
+        that carry an image into albums (sendMediaGroup, up to 10 per call).
+        Feeds without an image, a lone leftover, and albums Telegram rejects
+        (e.g. an image URL it cannot fetch) go out as plain messages; with
+        digest, those are joined into as few messages as fit Telegram's limit.
+
+        Args:
+            feeds (list[dict]): Feed entries, as for send_to_telegram().
+            ismute (bool): If True, override individual bot mute flags (send anyway).
+            albums (bool): Group feeds with an image into albums.
+            digest (bool): Join the plain messages into digest messages.
+        """
+        per_bot = {}
+        for feed in feeds:
+            for bot_name in feed.get("telegram", {}).get("bots", []):
+                token, chat_id, _, mute = self.reader.get_social_values("telegram", bot_name)
+                if mute and ismute:
+                    self.logger.debug(
+                        "Skipping Telegram message for '%s' due to mute setting.", feed.get("title", "")
+                    )
+                    continue
+                if ("telegram", bot_name) in self._rejected:
+                    continue
+                per_bot.setdefault(bot_name, (token, chat_id, []))[2].append(feed)
+        if per_bot:
+            await asyncio.gather(*(
+                self._send_telegram_batch(bot_name, token, chat_id, bot_feeds, albums, digest)
+                for bot_name, (token, chat_id, bot_feeds) in per_bot.items()
+            ))
+
+    async def _send_telegram_batch(self, bot_name, token, chat_id, feeds, albums, digest):
+        """
+        Send one Telegram bot's share of send_batch_to_telegram().
+        """
+        telebot = self._telegram_publisher(bot_name, token, chat_id)
+        size = TelegramBotPublisher.MEDIA_GROUP_MAX
+        if albums:
+            with_image = [f for f in feeds if is_valid_url(f.get("img_link"))]
+            singles = [f for f in feeds if not is_valid_url(f.get("img_link"))]
+        else:
+            with_image, singles = [], list(feeds)
+        for start in range(0, len(with_image), size):
+            chunk = with_image[start:start + size]
+            if len(chunk) < TelegramBotPublisher.MEDIA_GROUP_MIN:
+                singles.extend(chunk)
+                continue
+            media = [
+                (f["img_link"], self._telegram_text(f, TelegramBotPublisher.CAPTION_MAX)) for f in chunk
+            ]
+            self.logger.debug("Sending album of %d feeds to Telegram bot '%s'", len(chunk), bot_name)
+            result = await self._send("telegram", bot_name, telebot.send_media_group, media)
+            if not result.get("ok"):
+                self.logger.warning(
+                    "Telegram album rejected for bot '%s'; sending its %d feeds one by one.",
+                    bot_name, len(chunk)
+                )
+                singles.extend(chunk)
+        if digest and len(singles) > 1:
+            chunks = TelegramBotPublisher.join_messages([self._telegram_text(f) for f in singles])
+            self.logger.debug("Sending digest of %d feeds as %d messages to Telegram bot '%s'",
+                              len(singles), len(chunks), bot_name)
+            # one _send per message, in order, so each takes its own rate-limit token
+            for chunk in chunks:
+                await self._send("telegram", bot_name, telebot.send_message, chunk)
+        elif singles:
+            await asyncio.gather(*(
+                self._send("telegram", bot_name, telebot.send_message, self._telegram_text(f))
+                for f in singles
+            ))
+
     async def send_to_bluesky(self, feed: dict, ismute: bool = False):
         """
         Send a single feed to all configured Bluesky bots asynchronously.
@@ -146,40 +479,37 @@ class SocialSender:
             ismute (bool): If True, override individual bot mute flags (send anyway).
         """
         bots = feed.get("bluesky", {}).get("bots", [])
+        title = feed.get("title", "")
+        description = feed.get("description", "")
+        ai_comment = feed.get("ai-comment") or None
         tasks = []
+        link_to_use = None  # resolved once, on the first bot that is not muted
         for bot_name in bots:
             handle, password, service, mute = self.reader.get_social_values("bluesky", bot_name)
             if mute and ismute:
                 self.logger.debug(
-                    "Skipping Bluesky message for '%s' due to mute setting.", feed.get("title", "")
+                    "Skipping Bluesky message for '%s' due to mute setting.", title
                 )
                 continue
+            if ("bluesky", bot_name) in self._rejected:
+                continue
+            self.logger.debug("Sending new feed to Bluesky bot '%s' → %s", bot_name, title)
+            if link_to_use is None:
+                link_to_use = self._link_for(feed)
             self.logger.debug(
-                "Sending new feed to Bluesky bot '%s' → %s",
-                bot_name, feed.get("title", "")
-            )
-            if not is_valid_url(feed.get("short_link")):
-                link_to_use = feed.get("link", "")
-                self.logger.error("Invalid URL: %s", feed.get("short_link"))
-                self.logger.info("New URL: %s", link_to_use)
-            else:
-                link_to_use = feed.get("short_link") or feed.get("link", "")
-            self.logger.debug(
-                "BlueskyPoster init with handle=%s, service=%s", handle, service
-            )
-            self.logger.debug(
-                "Payload: %s\n%s",
-                feed.get("title",""), feed.get("description","")
+                "BlueskyPoster for handle=%s, service=%s", handle, service
             )
-            blueskybot = BlueskyPoster(handle, password, service)
-            ai_comment = feed.get("ai-comment") or None
+            self.logger.debug("Payload: %s\n%s", title, description)
+            blueskybot = self._bluesky_publisher(bot_name, handle, password, service)
             tasks.append(
-                run_in_thread(
+                self._send(
+                    "bluesky",
+                    bot_name,
                     blueskybot.post_feed,
-                    description=feed.get("description", ""),
+                    description=description,
                     link=link_to_use,
                     ai_comment=ai_comment,
-                    title=feed.get("title", "")
+                    title=title
                 )
             )
         if tasks:
@@ -195,43 +525,39 @@ class SocialSender:
             sleep_time (int): Time to wait before sending next batch (to avoid spamming).
         """
         bots = feed.get("linkedin", {}).get("bots", [])
+        title = feed.get("title", "")
+        description = feed.get("description", "")
+        ai_comment = feed.get("ai-comment") or None
         tasks = []
+        link_to_use = None  # resolved once, on the first bot that is not muted
         for bot_name in bots:
             urn, access_token, _, mute = self.reader.get_social_values("linkedin", bot_name)
             if mute and ismute:
                 self.logger.debug(
-                    "Skipping LinkedIn message for '%s' due to mute setting.", feed.get("title", "")
+                    "Skipping LinkedIn message for '%s' due to mute setting.", title
                 )
                 continue
-            self.logger.debug(
-                "Sending new feed to LinkedIn bot '%s' → %s",
-                bot_name, feed.get("title", "")
-            )
-            if not is_valid_url(feed.get("short_link")):
-                link_to_use = feed.get("link", "")
-                self.logger.error("Invalid URL: %s", feed.get("short_link"))
-                self.logger.info("New URL: %s", link_to_use)
-            else:
-                link_to_use = feed.get("short_link") or feed.get("link", "")
+            if ("linkedin", bot_name) in self._rejected:
+                continue
+            self.logger.debug("Sending new feed to LinkedIn bot '%s' → %s", bot_name, title)
+            if link_to_use is None:
+                link_to_use = self._link_for(feed)
             self.logger.debug(
                 "LinkedInPublisher init with urn=%s", urn
             )
-            self.logger.debug(
-                "Payload: %s\n%s",
-                feed.get("title",""), feed.get("description","")
-            )
-            linkedinbot = LinkedInPublisher(access_token, urn=urn, logger=self.logger)
-            ai_comment = feed.get("ai-comment") or None
-            text_for_post = ai_comment or feed.get("description", "")
+            self.logger.debug("Payload: %s\n%s", title, description)
+            linkedinbot = self._linkedin_publisher(bot_name, access_token, urn)
             # Random back-off to avoid spamming multiple bots simultaneously
             if sleep_time > 30:
                 rnd = random.uniform(0, sleep_time - (sleep_time / 2))
                 self.logger.debug("Backing off %.1f seconds before sending next batch", rnd)
                 await asyncio.sleep(rnd)
             tasks.append(
-                run_in_thread(
+                self._send(
+                    "linkedin",
+                    bot_name,
                     linkedinbot.post_link,
-                    text=text_for_post,
+                    text=ai_comment or description,
                     link=link_to_use,
                     category=feed.get("category", []),
                 )
@@ -2,7 +2,7 @@
 """
 telegram_bot_publisher.py
 
-Class for sending messages to a Telegram chat via a BotFather token.
+Class for sending messages (and photo albums) to a Telegram chat via a BotFather token.
 Includes a command-line interface for quick testing.
 
 Usage examples:
@@ -31,7 +31,7 @@ import requests
 # ------------------------------------------------------------------------------
 # Module version
 # ------------------------------------------------------------------------------
-__version__ = "1.0.0"
+__version__ = "1.3.1"
 
 
 # ------------------------------------------------------------------------------
@@ -49,13 +49,25 @@ class TelegramBotPublisher:
     Args:
         token_botfather (str): The Telegram bot token from BotFather.
         chat_id (str): The chat ID where the message will be sent.
+        session (requests.Session, optional): Shared HTTP session to reuse
+            pooled connections; a private one is created if omitted.
     """
 
-    def __init__(self, token_botfather, chat_id):
+    # Telegram accepts albums of 2 to 10 items, each caption up to 1024 chars,
+    # and text messages of up to 4096 chars
+    MEDIA_GROUP_MIN = 2
+    MEDIA_GROUP_MAX = 10
+    CAPTION_MAX = 1024
+    MESSAGE_MAX = 4096
+
+    def __init__(self, token_botfather, chat_id, session=None):
         self.token = token_botfather
         self.chat_id = chat_id
-        # Build the full sendMessage API endpoint URL
+        self.session = session or requests.Session()
+        # Build the full sendMessage / sendMediaGroup API endpoint URLs
         self.api_url = f"https://api.telegram.org/bot{self.token}/sendMessage"
+        self.media_group_url = f"https://api.telegram.org/bot{self.token}/sendMediaGroup"
+        self.get_me_url = f"https://api.telegram.org/bot{self.token}/getMe"
 
         # Class‐specific logger
         self.logger = logging.getLogger(self.__class__.__name__)
@@ -79,8 +91,91 @@ class TelegramBotPublisher:
         }
 
         self.logger.debug("Sending payload to Telegram API: %s", payload)
+        return self._post(self.api_url, data=payload)
+
+    @classmethod
+    def join_messages(cls, messages, separator="\n\n"):
+        """
+        Packs several texts into as few messages as possible: consecutive texts
+        are joined with the separator while the result fits MESSAGE_MAX.
+
+        Args:
+            messages (list[str]): The message texts, in order.
+            separator (str): Text placed between two joined messages.
+
+        Returns:
+            list[str]: The texts of the messages to send, in order.
+        """
+        chunks = []
+        current = ""
+        for text in messages:
+            if current and len(current) + len(separator) + len(text) <= cls.MESSAGE_MAX:
+                current += separator + text
+                continue
+            if current:
+                chunks.append(current)
+            current = text
+        if current:
+            chunks.append(current)
+        return chunks
+
+    def send_messages(self, messages, separator="\n\n"):
+        """
+        Sends several texts in as few messages as possible (see join_messages()).
+
+        Args:
+            messages (list[str]): The message texts, in order.
+            separator (str): Text placed between two joined messages.
+
+        Returns:
+            list[dict]: The JSON response from the Telegram API for each message sent.
+        """
+        chunks = self.join_messages(messages, separator)
+        self.logger.debug("Sending %d texts as %d Telegram messages", len(messages), len(chunks))
+        return [self.send_message(chunk) for chunk in chunks]
+
+    def ping(self):
+        """
+        Checks the bot token with a getMe call; nothing is sent to the chat.
+
+        Returns:
+            dict: The JSON response from the Telegram API.
+
+        Raises:
+            requests.HTTPError: If Telegram rejects the token.
+        """
+        response = self.session.get(self.get_me_url)
+        response.raise_for_status()
+        return response.json()
+
+    def send_media_group(self, media):
+        """
+        Sends several photos with captions as a single album (one API call).
+
+        Args:
+            media (list[tuple[str, str]]): (photo URL, caption) pairs, between
+                MEDIA_GROUP_MIN and MEDIA_GROUP_MAX of them.
+
+        Returns:
+            dict: The JSON response from the Telegram API.
+        """
+        payload = {
+            "chat_id": self.chat_id,
+            "media": [
+                {"type": "photo", "media": url, "caption": caption[:self.CAPTION_MAX]}
+                for url, caption in media
+            ],
+        }
+
+        self.logger.debug("Sending album of %d photos to Telegram API", len(media))
+        return self._post(self.media_group_url, json=payload)
+
+    def _post(self, url, **kwargs):
+        """
+        Private helper: POST to a Telegram API endpoint and return the parsed reply.
+        """
         try:
-            response = requests.post(self.api_url, data=payload)
+            response = self.session.post(url, **kwargs)
         except Exception as e:
             self.logger.error("Failed to send request to Telegram API: %s", e)
             return {"ok": False, "error": str(e)}
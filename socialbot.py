@@ -7,6 +7,8 @@ Main runner for SocialBot:
   - Dispatch new items to Telegram, Bluesky, and LinkedIn  
   - Respect quiet/mute time windows  
   - Schedule next run according to a cron expression  
+  - Wake up early and re-read settings/feeds/history on SIGHUP  
+  - Shut down gracefully on SIGTERM, like Ctrl-C  
 Usage:
     # Show version and exit
     python socialbot.py --version
@@ -19,23 +21,402 @@ Usage:
 import argparse
 import logging
 import asyncio
-from datetime import datetime
+import multiprocessing
+import os
+import signal
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta
+from typing import Dict, Optional
 
-from croniter import croniter
+try:
+    import uvloop
+except ImportError:  # uvloop is optional (and unavailable on Windows)
+    uvloop = None
 
-from utils.readjson import JSONReader
-from utils.utils import MuteTimeChecker
+from utils.readjson import JSONReader, JSONLReader
+from utils.utils import MuteTimeChecker, CronSchedule
+from utils.ai_cache import AICommentCache
 from rssfeeders.rssfeeders import RSSFeeders
 from gpt.get_ai_model import Model
-from senders.senders import SocialSender
+from gpt.gptcomment import (
+    BATCH_COMPLETION_WINDOW_HOURS, extract_article_texts, generate_comments_batch, poll_comment_batch, submit_comment_batch,
+)
+from senders.senders import SocialSender, create_http_session
 
-__version__ = "0.0.25"
+__version__ = "0.0.35"
 
 # ------------------------------------------------------------------------------
 # Module‐level logging configuration
 # ------------------------------------------------------------------------------
 LOG_FORMAT = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
 
+# Seconds in-flight sends may still run after a shutdown request
+SHUTDOWN_GRACE = 5
+
+# Max messages per second to a single bot/chat (0 = unlimited); Telegram
+# asks for at most one message per second in the same chat
+_SEND_RATE_DEFAULTS = {"telegram": 1.0, "bluesky": 0.0, "linkedin": 0.0}
+
+# Batch id prefix for parked items whose comments are already known (unsent
+# after a shutdown or held through a mute window): handed back without polling
+_READY_BATCH_PREFIX = "ready-"
+
+# Model used when ai_model is unset, or "auto" finds no priced model
+_DEFAULT_GPT_MODEL = "gpt-4.1-nano"
+
+# Keys every feed entry must carry before it is handed to RSSFeeders
+_FEED_DEFAULTS = {
+    "link": "",
+    "datetime": "",
+    "description": "",
+    "title": "",
+    "ai-comment": "",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class RunnerConfig:
+    """
+    Immutable snapshot of the runner settings, read once from settings.json
+    so the worker loop never walks the raw JSON again.
+    """
+
+    feeds_path: str
+    logfile: str
+    cron_expr: str
+    retention_days: Optional[int]
+    dispatch_concurrency: int
+    send_rates: Dict[str, float]
+    parse_workers: int
+    rss_workers: int
+    telegram_media_group: bool
+    telegram_digest: bool
+    feed_state_file: str
+    log_level: str
+    mute_from: str
+    mute_to: str
+    ai_max_chars: int
+    ai_lang: str
+    ai_base_url: str
+    gpt_model: str
+    ai_key: Optional[str]
+    ai_cache_file: str
+    ai_batch_size: int
+    ai_batch_api: bool
+
+    @classmethod
+    def from_reader(cls, reader):
+        """
+        Build the config from a loaded JSONReader, applying defaults.
+
+        Args:
+            reader (JSONReader): Reader holding the parsed settings.json.
+
+        Returns:
+            RunnerConfig: The resolved configuration.
+        """
+        settings = reader.get_value("settings", {}) or {}
+        mute = settings.get("mute", {}) or {}
+        ai = reader.get_value("ai", {}) or {}
+        return cls(
+            feeds_path=settings.get("feeds_file", "/opt/github/03_Script/Python/socialbot/feeds.json"),
+            logfile=settings.get("log_file", "/var/log/socialbot.log"),
+            cron_expr=settings.get("cron", "0 * * * *"),
+            retention_days=settings.get("days_of_retention", None),
+            dispatch_concurrency=int(settings.get("dispatch_concurrency", 8)),
+            send_rates={
+                platform: float(rate)
+                for platform, rate in {**_SEND_RATE_DEFAULTS, **(settings.get("send_rates", {}) or {})}.items()
+            },
+            parse_workers=max(0, int(settings.get("parse_workers", 0))),
+            rss_workers=max(1, int(settings.get("rss_workers", RSSFeeders.FETCH_CONCURRENCY))),
+            telegram_media_group=bool(settings.get("telegram_media_group", False)),
+            telegram_digest=bool(settings.get("telegram_digest", False)),
+            feed_state_file=settings.get("feed_state_file", "./feed_state.json"),
+            log_level=str(settings.get("log_level", "INFO")).upper(),
+            mute_from=mute.get("from", "00:00"),
+            mute_to=mute.get("to", "00:00"),
+            ai_max_chars=ai.get("ai_comment_max_chars", 160),
+            ai_lang=ai.get("ai_comment_language", "en"),
+            ai_base_url=ai.get("ai_base_url", "https://api.openai.com/v1"),
+            gpt_model=ai.get("ai_model", _DEFAULT_GPT_MODEL),
+            ai_key=ai.get("ai_key", None),
+            ai_cache_file=ai.get("ai_cache_file", "./ai_cache.db"),
+            ai_batch_size=int(ai.get("ai_batch_size", 10)),
+            ai_batch_api=bool(ai.get("ai_batch_api", False)),
+        )
+
+
+# ------------------------------------------------------------------------------
+# Settings that size resources built once at startup; a reload keeps them
+# ------------------------------------------------------------------------------
+_RESTART_ONLY = (
+    "logfile", "dispatch_concurrency", "send_rates", "parse_workers", "feed_state_file",
+    "ai_cache_file", "ai_batch_api",
+)
+
+
+def _file_mtime(path):
+    """
+    Return the file's st_mtime_ns, or None if it cannot be stat'ed.
+    """
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _reload_config(config_path, cfg, logger):
+    """
+    Re-read settings.json for a running bot.
+
+    Settings listed in _RESTART_ONLY keep their running values (with a
+    warning), and an "auto" model keeps the model resolved at startup.
+
+    Args:
+        config_path (str): Path to settings.json.
+        cfg (RunnerConfig): The configuration currently in use.
+        logger (logging.Logger): Logger passed through to JSONReader.
+
+    Returns:
+        tuple: (RunnerConfig, JSONReader) for the new settings, or (cfg, None)
+            if the file could not be read, in which case nothing changes.
+    """
+    reader = JSONReader(config_path, logger=logger)
+    if not isinstance(reader.get_data(), dict):
+        logger.error("Could not reload '%s'; keeping the running settings.", config_path)
+        return cfg, None
+    new = RunnerConfig.from_reader(reader)
+    if new.gpt_model == "auto":
+        new = replace(new, gpt_model=cfg.gpt_model)
+    kept = {name: getattr(cfg, name) for name in _RESTART_ONLY if getattr(new, name) != getattr(cfg, name)}
+    if kept:
+        logger.warning("Changed settings take effect after a restart: %s", ", ".join(kept))
+        new = replace(new, **kept)
+    return new, reader
+
+
+# ------------------------------------------------------------------------------
+# Loaded JSON files keyed by path; each reader re-parses only when its file changes
+# ------------------------------------------------------------------------------
+_json_cache: Dict[str, JSONReader] = {}
+
+
+async def _load_json_cached(path, logger, create=False):
+    """
+    Load a JSON file without blocking the event loop, re-parsing it only
+    when its modification time has changed since the previous call.
+
+    Args:
+        path (str): Path to the JSON file.
+        logger (logging.Logger): Logger passed through to JSONReader.
+        create (bool): Create the file as an empty list if it does not exist.
+
+    Returns:
+        dict or list or None: The parsed JSON data, or None on failure.
+    """
+    reader = _json_cache.get(path)
+    if reader is None:
+        reader = _json_cache[path] = await asyncio.to_thread(
+            JSONReader, path, create=create, logger=logger
+        )
+    elif not await asyncio.to_thread(reader.reload_if_changed):
+        logger.debug("Using cached content of '%s'", path)
+    return reader.get_data()
+
+
+# Feed definitions with _FEED_DEFAULTS applied, keyed by path: ((reader, version), feeds)
+_feeds_cache: Dict[str, tuple] = {}
+
+
+async def _load_feeds(path, logger):
+    """
+    Load the feed definitions with _FEED_DEFAULTS applied, normalizing them
+    again only when the feeds file was re-read (the cached dicts are never
+    modified downstream, so they can be handed out every cycle).
+
+    Args:
+        path (str): Path to feeds.json.
+        logger (logging.Logger): Logger passed through to JSONReader.
+
+    Returns:
+        list: The normalized feed definitions (empty on failure).
+    """
+    data = await _load_json_cached(path, logger) or []
+    # the reader itself is part of the key: SIGHUP replaces it, restarting versions
+    stamp = (_json_cache[path], _json_cache[path].version)
+    cached = _feeds_cache.get(path)
+    if cached is None or cached[0] != stamp:
+        cached = _feeds_cache[path] = (stamp, [{**_FEED_DEFAULTS, **feed} for feed in data])
+    return cached[1]
+
+
+async def _drain_dispatch(tasks, history, logger, recorded=frozenset()):
+    """
+    On shutdown, give in-flight dispatches SHUTDOWN_GRACE seconds to finish,
+    cancel the rest and record only the items that were fully sent, so they
+    are not posted again after a restart.
+
+    Args:
+        tasks (dict): Mapping of dispatch task to its feed item.
+        history (JSONLReader): The history log.
+        logger (logging.Logger): Logger for progress messages.
+        recorded (set): id() of items already in the history (not appended again).
+
+    Returns:
+        list: The items whose dispatch was cancelled or failed.
+    """
+    pending = [t for t in tasks if not t.done()]
+    if pending:
+        logger.info("Shutting down – waiting up to %ds for %d in-flight dispatches…",
+                    SHUTDOWN_GRACE, len(pending))
+        _, pending = await asyncio.wait(pending, timeout=SHUTDOWN_GRACE)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        if pending:
+            logger.warning("Cancelled %d unfinished dispatches; they will be retried next run.",
+                           len(pending))
+    done = {id(item) for task, item in tasks.items()
+            if not task.cancelled() and task.exception() is None}
+    history.append_records([item for item in tasks.values()
+                            if id(item) in done and id(item) not in recorded])
+    return [item for item in tasks.values() if id(item) not in done]
+
+
+def _submit_ai_batch(items, cfg, ai_cache, logger):
+    """
+    Queue the AI comments for items on the OpenAI Batch API and park the
+    items in the cache database until the batch is done. If the batch cannot
+    be submitted, comment them right away (and cache the comments) instead,
+    from the article texts already downloaded for the batch.
+
+    Returns:
+        bool: True if the items were queued, False if they were commented now.
+    """
+    links = [it["link"] for it in items]
+    texts = extract_article_texts(links, logger)
+    batch_id = submit_comment_batch(
+        links, cfg.ai_key, logger, cfg.ai_base_url, cfg.gpt_model, cfg.ai_max_chars, cfg.ai_lang,
+        texts=texts,
+    )
+    if batch_id is not None:
+        ai_cache.add_pending(batch_id, items)
+        return True
+    comments = generate_comments_batch(
+        links, cfg.ai_key, logger, cfg.ai_base_url, cfg.gpt_model,
+        cfg.ai_max_chars, cfg.ai_lang, cfg.ai_batch_size, texts=texts,
+    )
+    for item, comment in zip(items, comments):
+        item["ai-comment"] = comment
+    ai_cache.set_many(
+        (
+            AICommentCache.make_key(
+                cfg.gpt_model, cfg.ai_lang, cfg.ai_max_chars, item.get("title"), item.get("description")
+            ),
+            item["ai-comment"],
+        )
+        for item in items
+    )
+    return False
+
+
+def _collect_ai_batches(cfg, ai_cache, logger):
+    """
+    Poll the pending Batch API jobs and hand back the items of the finished
+    ones with their comments filled in (and cached). Articles the batch did
+    not comment (failed or expired job) are commented directly, and so are all
+    of a job that still cannot be read back after the completion window (e.g.
+    ai_key or ai_base_url changed since). The jobs stay pending until
+    _park_unsent() is called once the items were dispatched.
+
+    Returns:
+        tuple: (items ready to be dispatched, ids of the batches they came from).
+    """
+    ready, batch_ids = [], []
+    give_up = time.time() - BATCH_COMPLETION_WINDOW_HOURS * 3600
+    for batch_id, items, parked_at in ai_cache.pending_batches():
+        if batch_id.startswith(_READY_BATCH_PREFIX):
+            # commented and cached already, just not sent yet
+            ready.extend(items)
+            batch_ids.append(batch_id)
+            continue
+        comments = poll_comment_batch(batch_id, cfg.ai_key, logger, cfg.ai_base_url)
+        if comments is None:
+            if parked_at > give_up:
+                continue
+            logger.warning("Comment batch %s unfinished after %dh; commenting its %d items directly.",
+                           batch_id, BATCH_COMPLETION_WINDOW_HOURS, len(items))
+            comments = {}
+        missing = [i for i in range(len(items)) if not comments.get(i)]
+        if missing:
+            fallback = generate_comments_batch(
+                [items[i]["link"] for i in missing], cfg.ai_key, logger, cfg.ai_base_url,
+                cfg.gpt_model, cfg.ai_max_chars, cfg.ai_lang, cfg.ai_batch_size,
+            )
+            comments.update(zip(missing, fallback))
+        for i, item in enumerate(items):
+            item["ai-comment"] = comments.get(i, "")
+        ai_cache.set_many(
+            (
+                AICommentCache.make_key(
+                    cfg.gpt_model, cfg.ai_lang, cfg.ai_max_chars, item.get("title"), item.get("description")
+                ),
+                item["ai-comment"],
+            )
+            for item in items
+        )
+        ready.extend(items)
+        batch_ids.append(batch_id)
+    return ready, batch_ids
+
+
+def _park_unsent(ai_cache, batch_ids, unsent):
+    """
+    Retire collected batches once their items were dispatched, parking the
+    ones that were not sent (shutdown, mute window) under a fresh ready- id
+    so they are handed back on a later cycle or run. Collected items are in
+    the history already, so this is the only place they can be retried from.
+
+    Args:
+        ai_cache (AICommentCache): Cache database holding the pending batches.
+        batch_ids (list): Ids returned by _collect_ai_batches().
+        unsent (list): Collected items still to be sent.
+    """
+    if batch_ids:
+        ai_cache.replace_pending(batch_ids, f"{_READY_BATCH_PREFIX}{uuid.uuid4().hex}", unsent)
+
+
+def _load_history(history, retention_days=None):
+    """
+    Stream the history records, turning stored ISO datetimes back into
+    datetime objects and dropping records already past the retention period
+    as they are read (the startup compaction then removes them from disk).
+
+    Args:
+        history (JSONLReader): The history log.
+        retention_days (int, optional): Drop records older than this many days.
+
+    Returns:
+        list: The history records still within retention.
+    """
+    cutoff = datetime.now() - timedelta(days=retention_days) if retention_days else None
+    records = []
+    for item in history.iter_records():
+        dt = item.get("datetime")
+        if isinstance(dt, str) and dt:
+            try:
+                dt = item["datetime"] = datetime.fromisoformat(dt)
+            except ValueError:
+                pass
+        if cutoff is not None and isinstance(dt, datetime) and dt.tzinfo is None and dt < cutoff:
+            continue
+        records.append(item)
+    return records
+
 
 def main():
     """
@@ -56,9 +437,21 @@ def main():
     Config file options (settings.json):
       settings:
         feeds_file           Path to RSS feeds file (default: ./feeds.json).
-        log_file             Path to history/log file.
+        log_file             Path to the history file (JSON Lines, append-only).
         cron                 Cron expression for scheduling runs.
         days_of_retention    Number of days to keep old items.
+        dispatch_concurrency Max simultaneous sends per platform (default: 8).
+        send_rates           Max messages per second to one bot, per platform
+                             (default: {"telegram": 1, "bluesky": 0, "linkedin": 0}; 0 = unlimited).
+        parse_workers        Processes parsing downloaded feeds (default: 0 = worker
+                             threads; worth raising for many or very large feeds).
+        rss_workers          Max feeds downloaded at once (default: 16).
+        telegram_media_group Post a cycle's items with images to each Telegram chat
+                             as albums of up to 10 (default: false).
+        telegram_digest      Join a cycle's plain Telegram messages into as few
+                             messages as fit 4096 chars (default: false).
+        feed_state_file      JSON file keeping each feed's ETag/Last-Modified across
+                             restarts (default: ./feed_state.json, "" disables).
         mute:
           from               Mute window start time (HH:MM).
           to                 Mute window end time (HH:MM).
@@ -69,6 +462,13 @@ def main():
         ai_base_url          Base URL for the AI API (default: https://api.openai.com/v1).
         ai_model             GPT model to use (or "auto" for automatic selection).
         ai_key               OpenAI API key.
+        ai_cache_file        SQLite file caching AI comments (default: ./ai_cache.db, "" disables).
+        ai_batch_size        New articles commented per AI request (default: 10).
+        ai_batch_api         Comment through the OpenAI Batch API, posting the items
+                             one or more cycles later (default: false; needs
+                             ai_cache_file and a cron of at least one hour). Items
+                             still queued when it is turned off are posted once
+                             their batch finishes.
 
     Returns:
       None
@@ -101,67 +501,69 @@ def main():
     # Start with INFO or DEBUG based on CLI
     logger.setLevel(logging.DEBUG if args.debug else logging.INFO)
 
-    # --- Load initial config to see if config itself overrides log_level -------
-    reader_tmp = JSONReader(args.config_path, logger=logger)
-    if not args.debug:
-        cfg_level = reader_tmp.get_value("settings", {}).get("log_level", "INFO").upper()
-        logger.setLevel(getattr(logging, cfg_level, logging.INFO))
-
-    # --- Recreate reader with final logger level -------------------------------
+    # --- Load config once; it may override the log level ---------------------
     reader = JSONReader(args.config_path, logger=logger)
+    cfg = RunnerConfig.from_reader(reader)
+    if not args.debug:
+        logger.setLevel(getattr(logging, cfg.log_level, logging.INFO))
 
-    # --- Read important settings from config ----------------------------------
-    feeds_path = reader.get_value(
-        "settings", {}
-    ).get("feeds_file", "/opt/github/03_Script/Python/socialbot/feeds.json")
-    logfile = reader.get_value("settings", {}).get("log_file", "/var/log/socialbot.log")
-    cron_expr = reader.get_value("settings", {}).get("cron", "0 * * * *")
-    retention_days = reader.get_value("settings", {}).get("days_of_retention", None)
-
-    ai_max_chars = reader.get_value("ai", {}).get("ai_comment_max_chars", 160)
-    ai_lang = reader.get_value("ai", {}).get("ai_comment_language", "en")
-    ai_base_url = reader.get_value("ai", {}).get("ai_base_url", "https://api.openai.com/v1")
-    gpt_model = reader.get_value("ai", {}).get("ai_model", "gpt-4.1-nano")
-    ai_key = reader.get_value("ai", {}).get("ai_key", None)
-
-    mute_from = reader.get_value("settings", {}).get("mute", {}).get("from", "00:00")
-    mute_to = reader.get_value("settings", {}).get("mute", {}).get("to", "00:00")
-    mute_checker = MuteTimeChecker(mute_from, mute_to, logger=logger)
+    mute_checker = MuteTimeChecker(cfg.mute_from, cfg.mute_to, logger=logger)
 
     # --- Auto‑select GPT model if requested -----------------------------------
-    if gpt_model == "auto":
+    if cfg.gpt_model == "auto":
         logger.info("AI model set to 'auto', selecting cheapest GPT model …")
         # gpt_model = GPTModelSelector(ai_key, logger).get_cheapest_gpt_model()
-        raw = Model.fetch_raw_models(logger)
+        # a stale catalog is good enough to start on; it is refreshed meanwhile
+        raw = Model.fetch_raw_models(logger, background=True)
         models = Model.process_models(raw, logger)
         cheapest_model = Model.find_cheapest_model(models, logger, filter_str="openai")
-        gpt_model = cheapest_model.id
-        gpt_in_price = cheapest_model.prompt_price
-        gpt_out_price = cheapest_model.completion_price
+        if cheapest_model is not None:
+            cfg = replace(cfg, gpt_model=cheapest_model.id)
+            gpt_in_price = cheapest_model.prompt_price
+            gpt_out_price = cheapest_model.completion_price
+        else:
+            cfg = replace(cfg, gpt_model=_DEFAULT_GPT_MODEL)
+            logger.warning("No model catalog available; falling back to %s.", cfg.gpt_model)
+            gpt_in_price = 0
+            gpt_out_price = 0
     else:
         gpt_in_price = 0
         gpt_out_price = 0
 
     # --- Startup logging -------------------------------------------------------
     logger.info("Starting SocialBot – version %s", __version__)
+    logger.debug("Event loop: %s", "uvloop" if uvloop is not None else "asyncio default")
     logger.debug("Config file path: %s", args.config_path)
-    logger.info("Feeds file path: %s", feeds_path)
-    logger.info("Log file (history) path: %s", logfile)
-    logger.info("Cron schedule for updates: %s", cron_expr)
+    logger.info("Feeds file path: %s", cfg.feeds_path)
+    logger.info("Log file (history) path: %s", cfg.logfile)
+    logger.info("Cron schedule for updates: %s", cfg.cron_expr)
     logger.info(
         "Mute window from %s to %s → is_mute_time=%s",
-        mute_from, mute_to, mute_checker.is_mute_time()
+        cfg.mute_from, cfg.mute_to, mute_checker.is_mute_time()
     )
-    logger.info("Retention days: %s", retention_days)
-    logger.info("AI Base Url: %s", ai_base_url)
+    logger.info("Retention days: %s", cfg.retention_days)
+    logger.info("Dispatch concurrency per platform: %d", cfg.dispatch_concurrency)
+    logger.info("Send rate per bot (msg/s, 0 = unlimited): %s", cfg.send_rates)
+    logger.info("Feed parser processes (0 = threads): %d", cfg.parse_workers)
+    logger.info("Concurrent feed downloads: %d", cfg.rss_workers)
+    logger.info("Telegram albums: %s", cfg.telegram_media_group)
+    logger.info("Telegram digest: %s", cfg.telegram_digest)
+    logger.info("AI Base Url: %s", cfg.ai_base_url)
     logger.info(
         "AI model: %s - $%.2f/M input tokens | $%.2f/M output tokens",
-        gpt_model,
+        cfg.gpt_model,
         round(gpt_in_price * 1_000_000, 2),
         round(gpt_out_price * 1_000_000, 2)
     )
-    logger.info("AI comment max chars: %s", ai_max_chars)
-    logger.info("AI comment language: %s", ai_lang)
+    logger.info("AI comment max chars: %s", cfg.ai_max_chars)
+    logger.info("AI comment language: %s", cfg.ai_lang)
+    logger.info("AI comments per request: %d", cfg.ai_batch_size)
+
+    # --- Cache of generated AI comments (empty ai_cache_file disables it) -----
+    ai_cache = None
+    if cfg.ai_key and cfg.ai_cache_file:
+        ai_cache = AICommentCache(cfg.ai_cache_file, logger=logger)
+        logger.info("AI comment cache: %s", cfg.ai_cache_file)
 
     # --- Main fetch→post→sleep loop -------------------------------------------
     try:
@@ -170,72 +572,317 @@ def main():
         async def _worker_loop():
             nonlocal sleep_time
 
-            while True:
-                # Load history and feeds for this cycle
-                history_reader = JSONReader(logfile, create=True, logger=logger)
-                seen_items = history_reader.get_data() or []
-                feeds_reader = JSONReader(feeds_path, logger=logger)
-                all_feeds = feeds_reader.get_data() or []
-                # Ensure all feed entries have the necessary keys
-                for feed in all_feeds:
-                    feed.setdefault("link", "")
-                    feed.setdefault("datetime", "")
-                    feed.setdefault("description", "")
-                    feed.setdefault("title", "")
-                    feed.setdefault("ai-comment", "")
-                # Check if we are currently within the mute window
-                mute_flag = mute_checker.is_mute_time()
-                rss = RSSFeeders(
-                    all_feeds,
-                    seen_items,
-                    retention_days=retention_days,
-                    base_url=ai_base_url,
-                    logger=logger,
-                    mutetime=mute_flag
+            # One semaphore per platform caps simultaneous sends, so a burst of
+            # new items doesn't trip rate limits and a slow platform doesn't
+            # stall the others
+            send_limits = {
+                platform: asyncio.Semaphore(cfg.dispatch_concurrency)
+                for platform in ("telegram", "bluesky", "linkedin")
+            }
+            # One pooled HTTP session for every publisher, so keep-alive
+            # connections are reused across items, platforms and cycles
+            http_session = create_http_session(pool_size=max(10, cfg.dispatch_concurrency))
+            # A single sender holds no per-item state, so it is shared by every
+            # concurrent dispatch for the whole run. Its blocking POSTs get their
+            # own threads, one per allowed in-flight send, instead of queueing
+            # behind history writes and parsing in the default executor
+            send_executor = ThreadPoolExecutor(
+                max_workers=3 * cfg.dispatch_concurrency, thread_name_prefix="socialbot-send"
+            )
+            sender = SocialSender(
+                reader, logger, send_limits=send_limits, session=http_session,
+                send_rates=cfg.send_rates, executor=send_executor,
+            )
+
+            # History is an append-only JSON Lines log: read it once, append the
+            # new items each cycle and rewrite it only when compaction is due
+            history = JSONLReader(cfg.logfile, logger=logger)
+            seen_items = await asyncio.to_thread(_load_history, history, cfg.retention_days)
+            await asyncio.to_thread(history.compact, seen_items)
+
+            # SIGHUP wakes the loop early and forces settings/feeds/history to be
+            # re-read; SIGTERM (docker stop, systemd) unwinds like Ctrl-C, so
+            # in-flight sends still get their grace period
+            reload_event = asyncio.Event()
+            loop = asyncio.get_running_loop()
+            try:
+                loop.add_signal_handler(signal.SIGHUP, reload_event.set)
+                loop.add_signal_handler(signal.SIGTERM, asyncio.current_task().cancel)
+            except (AttributeError, NotImplementedError):
+                logger.debug("SIGHUP/SIGTERM handlers not available on this platform")
+
+            # Feeds are downloaded concurrently over one aiohttp session, reused every cycle
+            feed_session = RSSFeeders.create_session()
+            # ETag/Last-Modified per feed URL, so unchanged feeds answer 304; kept
+            # on disk so the first cycle after a restart is conditional too
+            feed_state = None
+            feed_validators = {}
+            if cfg.feed_state_file:
+                feed_state = await asyncio.to_thread(
+                    JSONReader, cfg.feed_state_file, create=True, logger=logger
+                )
+                if isinstance(feed_state.data, dict):
+                    feed_validators = feed_state.data
+            saved_validators = {url: dict(v) for url, v in feed_validators.items()}
+            # Optional process pool for feedparser, kept for the whole run so the
+            # workers start once; they ignore Ctrl-C and let the parent shut down
+            parse_pool = None
+            if cfg.parse_workers:
+                parse_pool = ProcessPoolExecutor(
+                    max_workers=cfg.parse_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=signal.signal,
+                    initargs=(signal.SIGINT, signal.SIG_IGN),
                 )
-                new_items, updated_history = rss.get_new_feeders(
-                    ai_key,
-                    gpt_model,
-                    ai_max_chars,
-                    ai_lang
+
+            # Cached AI comments are evicted at day granularity: once per date is enough
+            last_evict_date = None
+
+            # Upcoming cron slots, precomputed once for the whole run
+            schedule = CronSchedule(cfg.cron_expr)
+
+            # Batch API comments arrive a cycle or more later: only worth it
+            # (and only safe to hold items for) on hourly-or-slower schedules
+            batch_api = cfg.ai_batch_api and bool(cfg.ai_key)
+            if batch_api and ai_cache is None:
+                logger.warning("ai_batch_api needs ai_cache_file; commenting synchronously.")
+                batch_api = False
+            if batch_api:
+                if schedule.interval() < timedelta(hours=1):
+                    logger.warning("ai_batch_api ignored: cron fires more often than hourly.")
+                    batch_api = False
+                else:
+                    logger.info("AI comments go through the OpenAI Batch API.")
+
+            # settings.json is re-read when it changes on disk (checked each cycle) or on SIGHUP
+            settings_mtime = reader.mtime
+
+            async def _reload_settings():
+                nonlocal cfg, mute_checker, schedule, settings_mtime
+                settings_mtime = await asyncio.to_thread(_file_mtime, args.config_path)
+                new_cfg, new_reader = await asyncio.to_thread(
+                    _reload_config, args.config_path, cfg, logger
                 )
+                if new_reader is None:
+                    return
+                sender.reader = new_reader
+                if new_cfg.cron_expr != cfg.cron_expr:
+                    new_schedule = CronSchedule(new_cfg.cron_expr)
+                    if batch_api and new_schedule.interval() < timedelta(hours=1):
+                        logger.warning("New cron ignored: ai_batch_api needs an hourly or slower schedule.")
+                        new_cfg = replace(new_cfg, cron_expr=cfg.cron_expr)
+                    else:
+                        schedule = new_schedule
+                if (new_cfg.mute_from, new_cfg.mute_to) != (cfg.mute_from, cfg.mute_to):
+                    mute_checker = MuteTimeChecker(new_cfg.mute_from, new_cfg.mute_to, logger=logger)
+                if not args.debug:
+                    logger.setLevel(getattr(logging, new_cfg.log_level, logging.INFO))
+                cfg = new_cfg
 
-                if new_items:
-                    logger.info("Found %d new items – launching asynchronous dispatch…", len(new_items))
+            try:
+                # Probe every bot once, so bad credentials surface now rather
+                # than after the first cycle's fetch and AI comments
+                await sender.warmup(await _load_feeds(cfg.feeds_path, logger))
+                while True:
+                    cycle_start = time.perf_counter()
+                    if await asyncio.to_thread(_file_mtime, args.config_path) != settings_mtime:
+                        logger.info("Settings file changed – reloading it.")
+                        await _reload_settings()
+                    # Load feeds for this cycle, with all the necessary keys (served
+                    # from cache, and not re-normalized, if the file is unchanged)
+                    all_feeds = await _load_feeds(cfg.feeds_path, logger)
+                    # Check if we are currently within the mute window
+                    mute_flag = mute_checker.is_mute_time()
+                    all_muted = False
+                    # While muted, feeds whose bots are all mute-flagged would be fetched
+                    # (and commented) only to be dropped: leave them for after the window
+                    if mute_flag:
+                        all_feeds = [f for f in all_feeds if sender.is_deliverable(f, mute_flag)]
+                        if not all_feeds:
+                            all_muted = True
+                            logger.info("In mute window – every bot is muted, skipping fetch/AI this cycle.")
 
-                    async def _process_item(item):
-                        sender = SocialSender(reader, logger)
-                        # send in parallel to all configured channels
-                        await asyncio.gather(
-                            sender.send_to_telegram(item, mute_flag),
-                            sender.send_to_bluesky(item, mute_flag),
-                            sender.send_to_linkedin(item, mute_flag, sleep_time=sleep_time),
+                    # Batch API items parked in the cache database are already in the
+                    # history, so finished ones are handed back every cycle (from the
+                    # first, at startup), even with ai_batch_api since turned off or
+                    # every bot muted
+                    ready, ready_batches, held = [], [], []
+                    if ai_cache is not None and cfg.ai_key:
+                        ready, ready_batches = await asyncio.to_thread(
+                            _collect_ai_batches, cfg, ai_cache, logger
                         )
+                        if mute_flag:
+                            # what no bot may receive now stays parked until after the window
+                            held = [it for it in ready if not sender.is_deliverable(it, mute_flag)]
+                            ready = [it for it in ready if sender.is_deliverable(it, mute_flag)]
+                        if ready:
+                            logger.info("%d items received their batched AI comments.", len(ready))
 
-                    # create concurrent tasks for each new item
-                    tasks = [asyncio.create_task(_process_item(it)) for it in new_items]
-                    await asyncio.gather(*tasks)
+                    new_items = []
+                    if all_feeds:
+                        # the SQLite eviction overlaps the network-bound fetch below
+                        evict_task = None
+                        today = datetime.now().date()
+                        if ai_cache is not None and cfg.retention_days and today != last_evict_date:
+                            evict_task = asyncio.create_task(
+                                asyncio.to_thread(ai_cache.evict, cfg.retention_days)
+                            )
+                            last_evict_date = today
+                        rss = RSSFeeders(
+                            all_feeds,
+                            seen_items,
+                            retention_days=cfg.retention_days,
+                            base_url=cfg.ai_base_url,
+                            logger=logger,
+                            mutetime=mute_flag,
+                            ai_cache=ai_cache,
+                            ai_batch_size=cfg.ai_batch_size,
+                            defer_ai=batch_api,
+                            validators=feed_validators,
+                            fetch_concurrency=cfg.rss_workers,
+                        )
+                        new_items, updated_history = await rss.get_new_feeders_async(
+                            cfg.ai_key,
+                            cfg.gpt_model,
+                            cfg.ai_max_chars,
+                            cfg.ai_lang,
+                            session=feed_session,
+                            parse_pool=parse_pool,
+                        )
+                        seen_items = updated_history
+                        if evict_task is not None:
+                            await evict_task
 
-                    # save updated history
-                    history_reader.set_data(updated_history)
-                    logger.debug("Updated history written to %s", logfile)
-                else:
-                    logger.info("No new RSS items found this cycle.")
-
-                # compute next run time using cron schedule
-                cron_iter = croniter(cron_expr, datetime.now())
-                next_run = cron_iter.get_next(datetime)
-                sleep_time = (next_run - datetime.now()).total_seconds()
-                if sleep_time < 0:
-                    logger.warning("Negative sleep_time (%.1f); resetting to zero", sleep_time)
-                    sleep_time = 0.0
-                logger.info("Sleeping %d minutes until the next cycle…", int(sleep_time / 60))
-                await asyncio.sleep(sleep_time)
-
-        # lancio l'event loop
-        asyncio.run(_worker_loop())
+                        # Batch API: queue this cycle's comments
+                        if batch_api and rss.deferred and await asyncio.to_thread(
+                            _submit_ai_batch, rss.deferred, cfg, ai_cache, logger
+                        ):
+                            # parked until the batch is done; recorded now so they are not refetched
+                            queued = {id(it) for it in rss.deferred}
+                            new_items = [it for it in new_items if id(it) not in queued]
+                            await asyncio.to_thread(history.append_records, rss.deferred)
+                            logger.info("Queued %d items for batched AI comments.", len(rss.deferred))
+
+                    if new_items or ready:
+                        logger.info("Found %d new items – launching asynchronous dispatch…",
+                                    len(new_items) + len(ready))
+
+                        # with albums or digests, one task posts every item to Telegram
+                        # and each item with Telegram bots waits on it (shielded, so one
+                        # item's cancellation cannot abort the others' album)
+                        tg_batch = None
+                        if cfg.telegram_media_group or cfg.telegram_digest:
+                            tg_batch = asyncio.create_task(
+                                sender.send_batch_to_telegram(
+                                    new_items + ready, mute_flag,
+                                    albums=cfg.telegram_media_group, digest=cfg.telegram_digest,
+                                )
+                            )
+
+                        async def _await_tg_batch():
+                            # the shared batch's failure is not this item's: it is logged once below
+                            try:
+                                await asyncio.shield(tg_batch)
+                            except Exception:
+                                pass
+
+                        async def _process_item(item):
+                            # send in parallel to all configured channels; a failing
+                            # platform is logged without affecting the others (or the loop)
+                            platforms = ["Bluesky", "LinkedIn"]
+                            sends = [
+                                sender.send_to_bluesky(item, mute_flag),
+                                sender.send_to_linkedin(item, mute_flag, sleep_time=sleep_time),
+                            ]
+                            if tg_batch is None:
+                                platforms.append("Telegram")
+                                sends.append(sender.send_to_telegram(item, mute_flag))
+                            elif item.get("telegram", {}).get("bots"):
+                                platforms.append("Telegram")
+                                sends.append(_await_tg_batch())
+                            results = await asyncio.gather(*sends, return_exceptions=True)
+                            for platform, result in zip(platforms, results):
+                                if isinstance(result, Exception):
+                                    logger.error("Sending '%s' to %s failed: %s",
+                                                 item.get("title", ""), platform, result)
+
+                        # create concurrent tasks for each new item; asyncio.wait (unlike
+                        # gather) leaves them running if this loop gets cancelled
+                        tasks = {asyncio.create_task(_process_item(it)): it for it in new_items + ready}
+                        try:
+                            await asyncio.wait(tasks)
+                        except asyncio.CancelledError:
+                            collected = {id(it) for it in ready}
+                            unsent = await _drain_dispatch(tasks, history, logger, collected)
+                            # collected items are in the history: park the unsent ones again
+                            _park_unsent(ai_cache, ready_batches,
+                                         held + [it for it in unsent if id(it) in collected])
+                            raise
+                        await asyncio.gather(*tasks)
+                        if tg_batch is not None:
+                            (tg_result,) = await asyncio.gather(tg_batch, return_exceptions=True)
+                            if isinstance(tg_result, Exception):
+                                logger.error("Sending the Telegram batch of %d items failed: %s",
+                                             len(new_items) + len(ready), tg_result)
+
+                        # append the new items to the history, compacting when due
+                        await asyncio.to_thread(history.append_records, new_items)
+                        if history.needs_compaction():
+                            await asyncio.to_thread(history.compact, seen_items)
+                        logger.debug("Updated history written to %s", cfg.logfile)
+                    elif all_feeds:
+                        logger.info("No new RSS items found this cycle.")
+                    # only now are the collected batches done with
+                    if ready_batches:
+                        await asyncio.to_thread(_park_unsent, ai_cache, ready_batches, held)
+
+                    # saved only once this cycle's items are in the history, so a
+                    # crash cannot leave a feed "unchanged" with its item unsent
+                    if feed_state is not None and feed_validators != saved_validators:
+                        await asyncio.to_thread(feed_state.set_data, feed_validators)
+                        saved_validators = {url: dict(v) for url, v in feed_validators.items()}
+
+                    logger.debug("Cycle completed in %.2fs", time.perf_counter() - cycle_start)
+
+                    # compute next run time using cron schedule (one clock read,
+                    # never negative even if the wall clock jumped backwards)
+                    now = datetime.now()
+                    wake_after = now
+                    if all_muted:
+                        # nothing can be sent until the window ends: skip the cron
+                        # slots in between (SIGHUP still wakes the loop early)
+                        unmute = mute_checker.next_unmute(now)
+                        if unmute is not None:
+                            wake_after = max(now, unmute - timedelta(seconds=1))
+                            logger.info("Every bot muted until %s.", unmute.strftime("%H:%M"))
+                    sleep_time = max(0.0, (schedule.next_after(wake_after) - now).total_seconds())
+                    logger.info("Sleeping %d minutes until the next cycle…", int(sleep_time / 60))
+                    try:
+                        await asyncio.wait_for(reload_event.wait(), timeout=sleep_time)
+                    except asyncio.TimeoutError:
+                        pass
+                    else:
+                        logger.info("SIGHUP received – reloading settings, feeds and history now.")
+                        reload_event.clear()
+                        await _reload_settings()
+                        _json_cache.clear()
+                        seen_items = await asyncio.to_thread(_load_history, history, cfg.retention_days)
+            finally:
+                await feed_session.close()
+                if parse_pool is not None:
+                    parse_pool.shutdown(wait=False, cancel_futures=True)
+                sender.close()
+                if ai_cache is not None:
+                    ai_cache.close()
+
+        # lancio l'event loop (libuv-based uvloop when installed)
+        loop_factory = uvloop.new_event_loop if uvloop is not None else None
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            runner.run(_worker_loop())
     except KeyboardInterrupt:
         logger.info("KeyboardInterrupt received – shutting down SocialBot.")
+    except asyncio.CancelledError:
+        logger.info("SIGTERM received – shutting down SocialBot.")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+ai_cache.py  (version 1.4.0)
+
+SQLite-backed cache of AI-generated comments, so the same article content
+(reposts, links that changed only slightly) never costs a second AI call.
+
+Entries are keyed by a BLAKE2b digest of (model, language, max_chars,
+normalized title + description) and evicted after a retention period.
+The same database also holds the items waiting on an OpenAI Batch API job.
+
+Usage:
+    # Show version
+    python utils/ai_cache.py --version
+
+    # Show how many comments are cached
+    python utils/ai_cache.py --file ./ai_cache.db
+
+    # Drop cached comments older than 5 days
+    python utils/ai_cache.py --file ./ai_cache.db --evict-days 5
+
+Requirements:
+    Only the Python standard library.
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+__version__ = "1.4.0"
+
+
+def _load_items(payload: str) -> List[Dict[str, Any]]:
+    """
+    Decode parked items, turning the ISO datetimes json.dumps(default=str)
+    left behind back into datetime objects, like freshly fetched items.
+    """
+    items = json.loads(payload)
+    for item in items:
+        dt = item.get("datetime")
+        if isinstance(dt, str) and dt:
+            try:
+                item["datetime"] = datetime.fromisoformat(dt)
+            except ValueError:
+                pass
+    return items
+
+
+class AICommentCache:
+    """
+    Thread-safe SQLite store mapping article content to an AI comment.
+
+    Args:
+        db_path (str): Path to the SQLite database file (created if missing).
+        logger (logging.Logger, optional): External logger instance to use.
+        log_level (str): Logging level name if logger is not provided (default "INFO").
+
+    Example:
+        cache = AICommentCache("ai_cache.db")
+        key = AICommentCache.make_key("gpt-4.1-nano", "en", 160, title, description)
+        comment = cache.get(key)
+        if comment is None:
+            comment = generate()
+            cache.set(key, comment)
+    """
+
+    def __init__(self, db_path, logger=None, log_level="INFO"):
+        self.db_path = db_path
+        if logger is not None:
+            self.logger = logger
+        else:
+            self.logger = logging.getLogger(self.__class__.__name__)
+            self.logger.setLevel(getattr(logging, log_level.upper(), logging.INFO))
+
+        # Feeds are processed in a thread pool, so share one connection under a lock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS ai_comments ("
+                "key BLOB PRIMARY KEY, comment TEXT NOT NULL, ts INTEGER NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS pending_batches ("
+                "batch_id TEXT PRIMARY KEY, items TEXT NOT NULL, ts INTEGER NOT NULL)"
+            )
+        self.logger.debug("AI comment cache opened at '%s'", db_path)
+
+    @staticmethod
+    def make_key(model, language, max_chars, title, description) -> bytes:
+        """
+        Build the cache key for a comment request.
+
+        Title and description are lower-cased and whitespace-collapsed so
+        trivially different copies of the same article share a key.
+
+        Returns:
+            bytes: 32-byte BLAKE2b digest.
+        """
+        content = " ".join(f"{title or ''} {description or ''}".lower().split())
+        raw = f"{model}|{language}|{max_chars}|{content}"
+        return hashlib.blake2b(raw.encode("utf-8"), digest_size=32).digest()
+
+    def get(self, key: bytes) -> Optional[str]:
+        """
+        Return the cached comment for key, or None on a miss.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT comment FROM ai_comments WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: bytes, comment: str) -> None:
+        """
+        Store (or replace) the comment for key. Empty comments are not cached.
+        """
+        if not comment:
+            return
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO ai_comments (key, comment, ts) VALUES (?, ?, ?)",
+                (key, comment, int(time.time())),
+            )
+
+    def set_many(self, entries: Iterable[Tuple[bytes, str]]) -> None:
+        """
+        Store several (key, comment) pairs with one executemany in a single
+        transaction. Empty comments are skipped, as in set().
+        """
+        now = int(time.time())
+        rows = [(key, comment, now) for key, comment in entries if comment]
+        if not rows:
+            return
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO ai_comments (key, comment, ts) VALUES (?, ?, ?)",
+                rows,
+            )
+
+    def evict(self, days) -> int:
+        """
+        Delete entries older than the given number of days.
+
+        Returns:
+            int: Number of rows deleted.
+        """
+        cutoff = int(time.time() - days * 86400)
+        with self._lock, self._conn:
+            deleted = self._conn.execute(
+                "DELETE FROM ai_comments WHERE ts < ?", (cutoff,)
+            ).rowcount
+        if deleted:
+            self.logger.debug("Evicted %d cached AI comments older than %s days", deleted, days)
+        return deleted
+
+    def add_pending(self, batch_id: str, items: List[Dict[str, Any]]) -> None:
+        """
+        Remember the feed items whose comments are being produced by a batch job.
+        """
+        payload = json.dumps(items, ensure_ascii=False, default=str)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pending_batches (batch_id, items, ts) VALUES (?, ?, ?)",
+                (batch_id, payload, int(time.time())),
+            )
+
+    def pending_batches(self) -> List[Tuple[str, List[Dict[str, Any]], int]]:
+        """
+        Return every (batch_id, items, parked_at) triple still waiting, oldest
+        first; parked_at is the epoch time the items were stored.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT batch_id, items, ts FROM pending_batches ORDER BY ts"
+            ).fetchall()
+        return [(batch_id, _load_items(items), ts) for batch_id, items, ts in rows]
+
+    def drop_pending(self, batch_id: str) -> None:
+        """
+        Forget a batch once its items have been handed back.
+        """
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM pending_batches WHERE batch_id = ?", (batch_id,))
+
+    def replace_pending(
+        self,
+        batch_ids: Iterable[str],
+        new_id: Optional[str] = None,
+        items: Optional[List[Dict[str, Any]]] = None,
+    ) -> None:
+        """
+        In one transaction, forget the given batches and (if items is not
+        empty) park items under new_id, so a crash in between can neither
+        lose the items nor keep both copies.
+        """
+        rows = [(batch_id,) for batch_id in batch_ids]
+        with self._lock, self._conn:
+            self._conn.executemany("DELETE FROM pending_batches WHERE batch_id = ?", rows)
+            if items:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO pending_batches (batch_id, items, ts) VALUES (?, ?, ?)",
+                    (new_id, json.dumps(items, ensure_ascii=False, default=str), int(time.time())),
+                )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM ai_comments").fetchone()[0]
+
+    def close(self) -> None:
+        """
+        Close the underlying SQLite connection.
+        """
+        with self._lock:
+            self._conn.close()
+
+
+def main() -> None:
+    """
+    CLI entry point to inspect or trim an AI comment cache file.
+    """
+    parser = argparse.ArgumentParser(description="Inspect or trim the AI comment cache.")
+    parser.add_argument(
+        "-f", "--file",
+        required=True,
+        help="Path to the SQLite cache file.",
+    )
+    parser.add_argument(
+        "--evict-days",
+        type=int,
+        help="Delete cached comments older than this many days.",
+    )
+    parser.add_argument(
+        "--debug",
+        action="store_true",
+        help="Enable DEBUG-level logging.",
+    )
+    parser.add_argument(
+        "-V",
+        "--version",
+        action="version",
+        version=f"%(prog)s v{__version__}",
+        help="Show program version and exit.",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(format="%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+    cache = AICommentCache(args.file, log_level="DEBUG" if args.debug else "INFO")
+    if args.evict_days is not None:
+        deleted = cache.evict(args.evict_days)
+        cache.logger.info("Evicted %d entries", deleted)
+    cache.logger.info("%d comments cached in '%s'", len(cache), args.file)
+    cache.close()
+
+
+if __name__ == "__main__":
+    main()
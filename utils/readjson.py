@@ -5,6 +5,8 @@ json_reader.py
 Utility class for reading and writing JSON files with built-in logging.
 Provides easy methods to load, query, update, and persist JSON data,
 as well as to extract “social bot” credentials from structured JSON.
+Also provides JSONLReader, an append-only JSON Lines store used for the
+history of published items.
 
 This script can also be used as a command-line tool:
 
@@ -17,11 +19,19 @@ import json
 import os
 import logging
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    orjson = None
+
+# fdatasync skips the metadata flush but is missing on macOS and Windows
+_datasync = getattr(os, "fdatasync", os.fsync)
+
 
 # ------------------------------------------------------------------------------
 # Module version
 # ------------------------------------------------------------------------------
-__version__ = "1.0.1"
+__version__ = "1.4.3"
 
 
 # ------------------------------------------------------------------------------
@@ -31,6 +41,45 @@ LOG_FORMAT = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
 logging.basicConfig(level=logging.INFO, format=LOG_FORMAT)
 
 
+def _loads(text):
+    """
+    Parse a JSON string, using orjson when it is installed.
+    """
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _dumps(data):
+    """
+    Serialize data to pretty-printed UTF-8 JSON bytes, using orjson when it is
+    installed. Datetimes and other non-JSON types are written via str(), as
+    with the stdlib encoder, so the file format does not depend on the backend.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            data,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+        )
+    return json.dumps(data, indent=2, ensure_ascii=False, default=str).encode("utf-8")
+
+
+def _dumps_line(record):
+    """
+    Serialize one record to a compact, newline-terminated JSON Lines entry.
+    As in _dumps(), datetimes go through str() with either backend, so the
+    history reads the same whichever one wrote it.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            record,
+            default=str,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+        ) + b"\n"
+    return (json.dumps(record, ensure_ascii=False, default=str, separators=(",", ":")) + "\n").encode("utf-8")
+
+
 class JSONReader:
     """
     Utility class for reading and writing JSON files.
@@ -43,6 +92,10 @@ class JSONReader:
         data = reader.get_data()
         token, chat_id, _, mute = reader.get_social_values("telegram", "mybot")
         reader.set_data(updated_data)
+
+        # Long-lived readers pick up edits to the file without re-parsing it otherwise
+        if reader.reload_if_changed():
+            data = reader.get_data()
     """
 
     def __init__(self, file_path, create=False, logger=None, log_level="INFO"):
@@ -57,6 +110,11 @@ class JSONReader:
         """
         self.file_path = file_path
         self.data = None
+        # st_mtime_ns of the file as last read or written (None if unknown)
+        self.mtime = None
+        # Bumped whenever self.data changes; invalidates the credential memo
+        self.version = 0
+        self._social_cache = {}
 
         # Use provided logger or create a new one for this class
         if logger is not None:
@@ -66,8 +124,40 @@ class JSONReader:
             level = getattr(logging, log_level.upper(), logging.INFO)
             self.logger.setLevel(level)
 
-        self.logger.debug(f"Initializing JSONReader for '{self.file_path}', create={create}")
+        self.logger.debug("Initializing JSONReader for '%s', create=%s", self.file_path, create)
         self._read_file(create)
+        self._bump_version()
+
+    def _bump_version(self):
+        """
+        Private helper: mark self.data as changed, dropping memoized lookups.
+        """
+        self.version += 1
+        self._social_cache.clear()
+
+    def _stat_mtime(self):
+        """
+        Private helper: return the file's st_mtime_ns, or None if it cannot be stat'ed.
+        """
+        try:
+            return os.stat(self.file_path).st_mtime_ns
+        except OSError:
+            return None
+
+    def reload_if_changed(self):
+        """
+        Re-read the file only if its modification time differs from the one
+        seen at the last read (or the last read failed).
+
+        Returns:
+            bool: True if the file was re-read, False if the cached data is current.
+        """
+        mtime = self._stat_mtime()
+        if self.data is not None and mtime is not None and mtime == self.mtime:
+            return False
+        self._read_file()
+        self._bump_version()
+        return True
 
     def _read_file(self, create=False):
         """
@@ -83,6 +173,7 @@ class JSONReader:
                 with open(self.file_path, "w", encoding="utf-8") as fp:
                     json.dump([], fp)
                 self.data = []
+                self.mtime = self._stat_mtime()
                 self.logger.info(
                     "File '%s' not found; created new empty list at path.", self.file_path
                 )
@@ -93,7 +184,9 @@ class JSONReader:
                 self.data = None
             return
 
-        # Read existing file, removing lines with comments (//)
+        # Read existing file, removing lines with comments (//). The mtime is
+        # taken first so a write racing the read shows up as a change next time
+        self.mtime = self._stat_mtime()
         try:
             with open(self.file_path, 'r', encoding="utf-8") as fp:
                 lines = fp.readlines()
@@ -119,7 +212,7 @@ class JSONReader:
                 else:
                     cleaned_lines.append(line.rstrip())
             json_str = '\n'.join(cleaned_lines)
-            self.data = json.loads(json_str)
+            self.data = _loads(json_str)
             self.logger.debug("Successfully loaded JSON data from '%s'.", self.file_path)
 
         except FileNotFoundError:
@@ -175,9 +268,12 @@ class JSONReader:
             None
         """
         try:
-            with open(self.file_path, 'w', encoding="utf-8") as fp:
-                json.dump(data, fp, indent=4, ensure_ascii=False, default=str)
+            payload = _dumps(data)
+            with open(self.file_path, 'wb') as fp:
+                fp.write(payload)
             self.data = data
+            self.mtime = self._stat_mtime()
+            self._bump_version()
             self.logger.info("Data successfully written to '%s'.", self.file_path)
 
         except Exception as exc:
@@ -187,6 +283,9 @@ class JSONReader:
         """
         Extract credentials for a named social-bot entry.
 
+        Results are memoized per (social_type, name) until the data changes
+        (see `version`), so repeated sends do not rescan the settings.
+
         Args:
             social_type (str): Bot type, e.g. "telegram", "bluesky", or "linkedin".
             name (str): Name identifier of the bot entry.
@@ -198,6 +297,16 @@ class JSONReader:
                 - LinkedIn:   (urn, access_token, None, mute)
                 - On failure or not found: (None, None, None, None)
         """
+        key = (social_type, name)
+        cached = self._social_cache.get(key)
+        if cached is None:
+            cached = self._social_cache[key] = self._lookup_social_values(social_type, name)
+        return cached
+
+    def _lookup_social_values(self, social_type, name):
+        """
+        Private helper: scan the 'social' list for get_social_values().
+        """
         social_list = self.get_value("social", [])
         if not isinstance(social_list, list):
             self.logger.error("'social' key is not a list; found %s", type(social_list))
@@ -259,6 +368,175 @@ class JSONReader:
         return (None, None, None, None)
 
 
+class JSONLReader:
+    """
+    Append-only JSON Lines store: one record per line.
+
+    New records are appended (O(k) bytes per write) instead of rewriting the
+    whole file; compact() rewrites it atomically from the live records once
+    enough lines have been appended since the last rewrite. A legacy file
+    holding a single JSON array is still read and is converted on compact().
+
+    Example:
+        log = JSONLReader("history.jsonl")
+        records = log.get_data()
+        log.append_records(new_records)
+        if log.needs_compaction():
+            log.compact(live_records)
+    """
+
+    # Compact once appended lines exceed this fraction of the file
+    COMPACT_RATIO = 0.1
+
+    def __init__(self, file_path, logger=None, log_level="INFO"):
+        """
+        Initialize the JSONLReader with the path to the JSON Lines file.
+
+        Args:
+            file_path (str): Path to the file (created on first append if missing).
+            logger (logging.Logger, optional): External logger instance to use.
+            log_level (str): Logging level name if logger is not provided (default "INFO").
+        """
+        self.file_path = file_path
+        self.total_lines = 0
+        self.new_lines = 0
+        self._legacy = False
+
+        if logger is not None:
+            self.logger = logger
+        else:
+            self.logger = logging.getLogger(self.__class__.__name__)
+            level = getattr(logging, log_level.upper(), logging.INFO)
+            self.logger.setLevel(level)
+
+    def get_data(self):
+        """
+        Read every record from the file.
+
+        Returns:
+            list: The parsed records (empty if the file is missing or unreadable).
+        """
+        records = list(self.iter_records())
+        self.logger.debug("Loaded %d records from '%s'.", len(records), self.file_path)
+        return records
+
+    def iter_records(self):
+        """
+        Yield the records one at a time, reading the file line by line, so a
+        caller can filter them (e.g. by age) without first holding the whole
+        file and every record in memory.
+
+        Yields:
+            dict: The parsed records (none if the file is missing or unreadable).
+        """
+        self.total_lines = 0
+        self.new_lines = 0
+        self._legacy = False
+        try:
+            fp = open(self.file_path, "rb")
+        except FileNotFoundError:
+            self.logger.debug("File '%s' not found; starting empty.", self.file_path)
+            return
+        except Exception as exc:
+            self.logger.error("Unexpected error reading '%s': %s", self.file_path, exc)
+            return
+
+        with fp:
+            for lineno, line in enumerate(fp, 1):
+                if not line.strip():
+                    continue
+                # Files written before the switch to JSON Lines hold one JSON array
+                if self.total_lines == 0 and line.lstrip().startswith(b"["):
+                    yield from self._read_legacy(line + fp.read())
+                    return
+                self.total_lines += 1
+                try:
+                    yield _loads(line)
+                except ValueError as exc:
+                    # Typically a line cut short by a crash mid-append; compaction drops it
+                    self.logger.warning("Skipping bad line %d in '%s': %s", lineno, self.file_path, exc)
+                    self.new_lines += 1
+
+    def _read_legacy(self, raw):
+        """
+        Private helper: parse a legacy single-array file for iter_records().
+        """
+        try:
+            records = _loads(raw)
+        except ValueError as exc:
+            self.logger.error("Failed to decode JSON from '%s': %s", self.file_path, exc)
+            return []
+        self._legacy = True
+        self.total_lines = len(records)
+        self.logger.info("Read legacy JSON array from '%s'; it will be rewritten as JSON Lines.",
+                         self.file_path)
+        return records
+
+    def append_record(self, record):
+        """
+        Append a single record to the file.
+
+        Args:
+            record (dict): The record to write.
+        """
+        self.append_records([record])
+
+    def append_records(self, records):
+        """
+        Append several records to the file with a single synced write, so a
+        crash right after a cycle cannot lose the items it just published.
+
+        Args:
+            records (list): The records to write.
+        """
+        if not records:
+            return
+        try:
+            payload = b"".join(_dumps_line(r) for r in records)
+            with open(self.file_path, "ab") as fp:
+                fp.write(payload)
+                fp.flush()
+                _datasync(fp.fileno())
+            self.total_lines += len(records)
+            self.new_lines += len(records)
+            self.logger.debug("Appended %d records to '%s'.", len(records), self.file_path)
+        except Exception as exc:
+            self.logger.error("Error appending to '%s': %s", self.file_path, exc)
+
+    def needs_compaction(self):
+        """
+        Tell whether the file should be rewritten by compact().
+
+        Returns:
+            bool: True for a legacy file or once appended lines exceed COMPACT_RATIO.
+        """
+        if self._legacy:
+            return True
+        return self.total_lines > 0 and self.new_lines / self.total_lines > self.COMPACT_RATIO
+
+    def compact(self, records):
+        """
+        Atomically replace the file with exactly the given records.
+
+        Args:
+            records (list): The live records to keep.
+        """
+        tmp_path = f"{self.file_path}.tmp"
+        try:
+            payload = b"".join(_dumps_line(r) for r in records)
+            with open(tmp_path, "wb") as fp:
+                fp.write(payload)
+                fp.flush()
+                _datasync(fp.fileno())
+            os.replace(tmp_path, self.file_path)
+            self.total_lines = len(records)
+            self.new_lines = 0
+            self._legacy = False
+            self.logger.info("Compacted '%s' to %d records.", self.file_path, len(records))
+        except Exception as exc:
+            self.logger.error("Error compacting '%s': %s", self.file_path, exc)
+
+
 def main():
     """
     Command-line interface for JSONReader.
@@ -311,7 +589,7 @@ def main():
     # Dump entire JSON content
     data = reader.get_data()
     reader.logger.info("Full JSON data (pretty-printed):")
-    reader.logger.info(json.dumps(data, indent=4, ensure_ascii=False))
+    reader.logger.info(_dumps(data).decode("utf-8"))
 
     # Example: retrieve a top-level key 'rss'
     rss_val = reader.get_value("rss", default="(not found)")
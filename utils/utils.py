@@ -1,6 +1,8 @@
-from datetime import datetime
+from datetime import datetime, timedelta
+import heapq
 import sys
 import os
+from croniter import croniter
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from logger import Logger
 
@@ -23,23 +25,103 @@ class MuteTimeChecker:
         else:
             self.logger = Logger.get_logger(__name__, level=log_level)
 
+        # Parse the window once into minutes since midnight, so each check is
+        # a couple of integer comparisons
+        try:
+            from_time = datetime.strptime(mute_from, "%H:%M")
+            to_time = datetime.strptime(mute_to, "%H:%M")
+            self._from_min = from_time.hour * 60 + from_time.minute
+            self._to_min = to_time.hour * 60 + to_time.minute
+        except ValueError as e:
+            self.logger.error("Error parsing mute times: %s", e)
+            self._from_min = self._to_min = None
+        self._cached = (None, True)
+
     def is_mute_time(self) -> bool:
         """
         Returns True if the current time is OUTSIDE the mute interval, False otherwise.
+        The result is computed at minute granularity and cached for that minute.
         """
-        try:
-            now = datetime.now().time()
-            mute_from_time = datetime.strptime(self.mute_from, "%H:%M").time()
-            mute_to_time = datetime.strptime(self.mute_to, "%H:%M").time()
-
-            # Special case: mute_from == mute_to means never mute
-            if mute_from_time == mute_to_time:
-                return True
-
-            if mute_from_time < mute_to_time:
-                return not (mute_from_time <= now <= mute_to_time)
-            else:
-                return not (now >= mute_from_time or now <= mute_to_time)
-        except ValueError as e:
-            self.logger.error(f"Error parsing mute times: {e}")
-            return True
\ No newline at end of file
+        now = datetime.now()
+        minute = now.hour * 60 + now.minute
+        cached_minute, flag = self._cached
+        if cached_minute == minute:
+            return flag
+
+        if self._from_min is None:
+            flag = True
+        # Special case: mute_from == mute_to means never mute
+        elif self._from_min == self._to_min:
+            flag = True
+        elif self._from_min < self._to_min:
+            flag = not (self._from_min <= minute <= self._to_min)
+        else:
+            flag = not (minute >= self._from_min or minute <= self._to_min)
+
+        self._cached = (minute, flag)
+        return flag
+
+    def next_unmute(self, now: datetime = None):
+        """
+        Returns the next time the mute interval starts, i.e. when is_mute_time()
+        turns False, or None if it never does (mute_from == mute_to or bad times).
+        """
+        if self._from_min is None or self._from_min == self._to_min:
+            return None
+        now = now or datetime.now()
+        hour, minute = divmod(self._from_min, 60)
+        start = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        if start <= now:
+            start += timedelta(days=1)
+        return start
+
+
+class CronSchedule:
+    """
+    Upcoming fire times of a fixed cron expression, precomputed into a heap
+    so each wake-up is a pop instead of a fresh croniter scan.
+    """
+    def __init__(self, cron_expr: str, start: datetime = None, batch: int = 256, low_watermark: int = 16):
+        """
+        :param cron_expr: Cron expression (e.g. "*/10 * * * *").
+        :param start: Time to schedule from (default: now).
+        :param batch: How many fire times to precompute per refill.
+        :param low_watermark: Refill once fewer than this many times are left.
+        """
+        self.cron_expr = cron_expr
+        self.batch = batch
+        self.low_watermark = low_watermark
+        self._iter = croniter(cron_expr, start or datetime.now())
+        self._heap = []
+        self._refill()
+
+    def _refill(self):
+        for _ in range(self.batch):
+            heapq.heappush(self._heap, self._iter.get_next(datetime))
+
+    def interval(self):
+        """
+        Returns the shortest gap between consecutive queued fire times, without
+        consuming them (irregular expressions like "0,45 9 * * *" can fire
+        closer together later than between the next two slots).
+        """
+        slots = sorted(self._heap)
+        return min(b - a for a, b in zip(slots, slots[1:]))
+
+    def next_after(self, now: datetime) -> datetime:
+        """
+        Returns the first fire time strictly after `now`. Slots that are already
+        past (an overrunning cycle) are dropped rather than caught up, and the
+        returned slot stays queued until it has passed, so waking early
+        (e.g. on SIGHUP) does not skip it.
+        """
+        while True:
+            while self._heap and self._heap[0] <= now:
+                heapq.heappop(self._heap)
+            if len(self._heap) < self.low_watermark:
+                if not self._heap:
+                    # fell behind by a whole batch (e.g. suspended host): restart from now
+                    self._iter.set_current(now)
+                self._refill()
+                continue
+            return self._heap[0]